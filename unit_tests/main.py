@@ -9,6 +9,8 @@ from test_test_executor import TestTestExecutor
 from test_test_listener import TestTestListener
 from test_suite_parser import TestSuiteParser
 from test_test_result import TestTestResult
+from test_recording_persistence import TestRecordingPersistence
+from test_playback_session_base import TestPlaybackSessionBase
 
 if __name__ == "__main__":
     unittest.main()
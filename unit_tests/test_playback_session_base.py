@@ -0,0 +1,101 @@
+import logging
+import unittest
+from unittest.mock import patch
+from webweaver.studio.browsing.studio_browser import PlaybackStepResult
+from webweaver.studio.playback.playback_session_base import \
+    PlaybackSessionBase
+from webweaver.studio.studio_solution import ScreenshotPolicy
+
+
+class _Solution:
+    default_screenshots_policy = ScreenshotPolicy.OFF
+
+
+class _Session(PlaybackSessionBase):
+
+    def __init__(self, step_count: int, failing_step: int = -1):
+        super().__init__(logging.getLogger("test"), _Solution(), None, None)
+        self.executed = []
+        self._total_steps = step_count
+        self._failing_step = failing_step
+
+    def _get_step_count(self) -> int:
+        return self._total_steps
+
+    def _execute_step(self, index: int):
+        self.executed.append(index)
+        if index == self._failing_step:
+            return PlaybackStepResult.fail("failed")
+        return PlaybackStepResult.success()
+
+    def begin(self):
+        """ Put the session into its running state without a thread. """
+        self._running = True
+        self._step_count = self._get_step_count()
+
+
+@patch("webweaver.studio.playback.playback_session_base.wx.CallAfter",
+       new=lambda func, *args: func(*args))
+class TestPlaybackSessionBase(unittest.TestCase):
+
+    def _session(self, step_count: int, failing_step: int = -1):
+        session = _Session(step_count, failing_step)
+        self.events = []
+        callbacks = session.callback_events
+        callbacks.on_step_started = lambda i: self.events.append(("start", i))
+        callbacks.on_step_passed = lambda i: self.events.append(("pass", i))
+        callbacks.on_step_failed = \
+            lambda i, _: self.events.append(("fail", i))
+        session.begin()
+        return session
+
+    def test_fast_forward_runs_on_next_batch(self):
+        session = self._session(10)
+
+        session.fast_forward(4)
+        self.assertEqual(session.executed, [])
+
+        self.assertTrue(session.step_batch(1))
+        self.assertEqual(session.executed, [0, 1, 2, 3, 4])
+        self.assertEqual(self.events, [("start", 3), ("pass", 3),
+                                       ("start", 4), ("pass", 4)])
+
+    def test_fast_forward_requests_accumulate(self):
+        session = self._session(10)
+
+        session.fast_forward(2)
+        session.fast_forward(3)
+        session.step_batch(0)
+
+        self.assertEqual(session.executed, [0, 1, 2, 3, 4])
+
+    def test_fast_forward_is_clamped_to_remaining_steps(self):
+        session = self._session(3)
+
+        session.fast_forward(100)
+
+        self.assertTrue(session.step_batch(0))
+        self.assertEqual(session.executed, [0, 1, 2])
+        self.assertFalse(session.step_batch(1))
+
+    def test_fast_forward_stops_on_failure(self):
+        session = self._session(10, failing_step=2)
+
+        session.fast_forward(5)
+
+        self.assertFalse(session.step_batch(1))
+        self.assertEqual(session.executed, [0, 1, 2])
+        self.assertEqual(self.events, [("fail", 2)])
+
+    def test_fast_forward_ignores_non_positive_steps(self):
+        session = self._session(10)
+
+        session.fast_forward(0)
+        session.fast_forward(-3)
+        session.step_batch(1)
+
+        self.assertEqual(session.executed, [0])
+
+
+if __name__ == "__main__":
+    unittest.main()
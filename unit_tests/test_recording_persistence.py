@@ -0,0 +1,110 @@
+from pathlib import Path
+import gzip
+import os
+import stat
+import tempfile
+import unittest
+from webweaver.studio.persistence.recording_persistence import (
+    RecordingLoadError,
+    RecordingPersistence,
+    read_recording_text,
+    recording_file_stem,
+    write_recording_file)
+from webweaver.studio.recording_metadata import (RecordingLoadError as
+                                                 MetadataLoadError,
+                                                 RecordingMetadata)
+
+RECORDING_TEXT = '{"version": 1, "recording": {"id": "1", "name": "Test", ' \
+                 '"createdAt": "2026-01-01T00-00-00", "events": []}}'
+
+
+def _corrupt_gzip(text: str) -> bytes:
+    """
+    Build a .wwrec.gz payload with a valid gzip header but a damaged deflate
+    stream, which gzip reports as a zlib.error rather than an EOFError.
+    """
+    data = bytearray(gzip.compress(text.encode("utf-8"), compresslevel=0))
+
+    # Flip the stored block length that follows the 10-byte gzip header and
+    # the 1-byte block header.
+    data[11] ^= 0xFF
+    return bytes(data)
+
+
+class TestRecordingPersistence(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name: str, data: bytes) -> Path:
+        path = self._dir / name
+        path.write_bytes(data)
+        return path
+
+    def test_read_compressed_recording(self):
+        path = self._write("rec.wwrec.gz",
+                           gzip.compress(RECORDING_TEXT.encode("utf-8")))
+
+        self.assertEqual(read_recording_text(path), RECORDING_TEXT)
+
+    def test_read_corrupt_compressed_recording(self):
+        path = self._write("rec.wwrec.gz", _corrupt_gzip(RECORDING_TEXT))
+
+        with self.assertRaises(OSError):
+            read_recording_text(path)
+
+    def test_read_truncated_compressed_recording(self):
+        data = gzip.compress(RECORDING_TEXT.encode("utf-8"))
+        path = self._write("rec.wwrec.gz", data[:len(data) // 2])
+
+        with self.assertRaises(OSError):
+            read_recording_text(path)
+
+    def test_load_corrupt_compressed_recording(self):
+        path = self._write("rec.wwrec.gz", _corrupt_gzip(RECORDING_TEXT))
+
+        with self.assertRaises(RecordingLoadError):
+            RecordingPersistence.load_from_disk(path)
+
+    def test_metadata_from_corrupt_compressed_recording(self):
+        path = self._write("rec.wwrec.gz", _corrupt_gzip(RECORDING_TEXT))
+
+        result = RecordingMetadata.from_file(path)
+
+        self.assertIsNone(result.recording)
+        self.assertEqual(result.error, MetadataLoadError.FILE_MALFORMED)
+
+    def test_metadata_from_non_utf8_compressed_recording(self):
+        path = self._write("rec.wwrec.gz", gzip.compress(b"\xff\xfe{}"))
+
+        result = RecordingMetadata.from_file(path)
+
+        self.assertIsNone(result.recording)
+        self.assertEqual(result.error, MetadataLoadError.FILE_MALFORMED)
+
+    def test_recording_file_stem(self):
+        self.assertEqual(recording_file_stem(Path("dir/name.wwrec")), "name")
+        self.assertEqual(recording_file_stem(Path("dir/name.wwrec.gz")),
+                         "name")
+        self.assertEqual(recording_file_stem(Path("dir/name.txt")),
+                         "name.txt")
+
+    @unittest.skipIf(os.name != "posix", "POSIX permission bits required")
+    def test_write_keeps_existing_file_mode(self):
+        path = self._write("rec.wwrec", b"{}")
+        os.chmod(path, 0o600)
+
+        write_recording_file(path, RECORDING_TEXT.encode("utf-8"),
+                             durable=False)
+
+        self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o600)
+        self.assertEqual(path.read_text(encoding="utf-8"), RECORDING_TEXT)
+        self.assertEqual(list(self._dir.iterdir()), [path])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -97,7 +97,10 @@ class ApiClient:
     results as :class:`ApiResponse` objects for consistent handling.
 
     Notes:
-        - Each request creates a new ``aiohttp.ClientSession``.
+        - By default each request creates a new ``aiohttp.ClientSession``.
+          With ``persistent_session`` enabled a single session is shared
+          across requests so connections are kept alive; the caller must
+          then await :meth:`close` on the same event loop when finished.
         - JSON responses are automatically deserialized.
         - Network and timeout errors are captured and returned inside
           an ``ApiResponse`` instead of raising exceptions.
@@ -105,6 +108,28 @@ class ApiClient:
 
     CONTENT_TYPE_JSON: str = "application/json"
 
+    def __init__(self, persistent_session: bool = False):
+        """
+        Initialise an ApiClient instance.
+
+        Args:
+            persistent_session:
+                If True, reuse one ``aiohttp.ClientSession`` (and its
+                connection pool) for every request made by this client.
+        """
+        self._persistent_session: bool = persistent_session
+        self._session: aiohttp.ClientSession | None = None
+
+    async def close(self):
+        """
+        Close the shared client session, if one has been opened.
+
+        Only needed when the client was created with ``persistent_session``.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     # Convenience wrappers for specific HTTP methods
     async def call_api_post(self,
                             url: str,
@@ -205,37 +230,81 @@ class ApiClient:
         # pylint: disable=too-many-arguments, too-many-positional-arguments
 
         try:
+            if self._persistent_session:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession()
+
+                return await self._send_request(
+                    self._session, method, url, body, body_type,
+                    aiohttp.ClientTimeout(total=timeout))
+
             async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(
                     total=timeout)) as session:
-                # Dynamically get the aiohttp method (get, post, delete, etc.)
-                http_method = getattr(session, method.lower())
+                return await self._send_request(session, method, url, body,
+                                                body_type)
 
-                request_kwargs = {}
-                headers = {}
+        except (aiohttp.ClientConnectionError,
+                aiohttp.ClientError,
+                asyncio.TimeoutError) as ex:
+            return ApiResponse(exception_msg=str(ex))
 
-                if body is not None:
-                    if body_type == RestApiBodyType.JSON:
-                        if isinstance(body, str):
-                            body = json.loads(body)
+    async def _send_request(self,
+                            session: aiohttp.ClientSession,
+                            method: str,
+                            url: str,
+                            body: Any,
+                            body_type: RestApiBodyType,
+                            timeout: aiohttp.ClientTimeout | None = None
+                            ) -> "ApiResponse":
+        """
+        Send a single request on the given session and wrap the response.
 
-                        request_kwargs = {"json": body}
-                    else:
-                        headers = {"Content-Type": REST_API_CONTENT_TYPE[body_type]}
+        Args:
+            session:
+                Client session used to send the request.
+            method:
+                HTTP method name (e.g. ``"get"``, ``"post"``, ``"delete"``).
+            url:
+                Target endpoint URL.
+            body:
+                Optional request payload.
+            body_type:
+                Request payload type.
+            timeout:
+                Optional per-request timeout, overriding the session's.
+
+        Returns:
+            ApiResponse representing the server's response.
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
 
-                        request_kwargs = {"data": body}
+        # Dynamically get the aiohttp method (get, post, delete, etc.)
+        http_method = getattr(session, method.lower())
 
-                async with http_method(url, headers=headers, **request_kwargs) as resp:
-                    if resp.content_type == self.CONTENT_TYPE_JSON:
-                        body = await resp.json()
-                    else:
-                        body = await resp.text()
+        request_kwargs = {}
+        headers = {}
 
-                    return ApiResponse(
-                        status_code=resp.status,
-                        body=body,
-                        content_type=resp.content_type)
+        if body is not None:
+            if body_type == RestApiBodyType.JSON:
+                if isinstance(body, str):
+                    body = json.loads(body)
 
-        except (aiohttp.ClientConnectionError,
-                aiohttp.ClientError,
-                asyncio.TimeoutError) as ex:
-            return ApiResponse(exception_msg=str(ex))
+                request_kwargs = {"json": body}
+            else:
+                headers = {"Content-Type": REST_API_CONTENT_TYPE[body_type]}
+
+                request_kwargs = {"data": body}
+
+        if timeout is not None:
+            request_kwargs["timeout"] = timeout
+
+        async with http_method(url, headers=headers, **request_kwargs) as resp:
+            if resp.content_type == self.CONTENT_TYPE_JSON:
+                body = await resp.json()
+            else:
+                body = await resp.text()
+
+            return ApiResponse(
+                status_code=resp.status,
+                body=body,
+                content_type=resp.content_type)
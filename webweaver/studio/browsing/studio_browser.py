@@ -39,7 +39,7 @@ class PlaybackActionError(RuntimeError):
     """Raised when a playback action fails semantically."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlaybackStepResult:
     """
     Result object representing the outcome of executing a single playback step.
@@ -54,6 +54,9 @@ class PlaybackStepResult:
 
     :ivar ok: True if the playback step completed successfully, False otherwise.
     :ivar error: Human-readable error message describing the failure. Empty if ok is True.
+
+    Instances are immutable, which allows every successful step to share the
+    same result object rather than allocating a new one.
     """
     ok: bool
     error: str = ""
@@ -63,9 +66,10 @@ class PlaybackStepResult:
         """
         Create a PlaybackStepResult representing a successful playback step.
 
-        :return: A PlaybackStepResult with ok=True and an empty error message.
+        :return: The shared PlaybackStepResult with ok=True and an empty error
+                 message.
         """
-        return PlaybackStepResult(True, "")
+        return _PLAYBACK_STEP_SUCCESS
 
     @staticmethod
     def fail(msg: str):
@@ -78,6 +82,9 @@ class PlaybackStepResult:
         return PlaybackStepResult(False, msg)
 
 
+_PLAYBACK_STEP_SUCCESS = PlaybackStepResult(True, "")
+
+
 class StudioBrowser:
     """
     High-level wrapper around a Selenium WebDriver instance used by WebWeaver Studio.
@@ -17,11 +17,43 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import functools
 from io import BytesIO
 import typing
 import wx
 
 
+@functools.lru_cache(maxsize=None)
+def load_png_bitmap(png_bytes: bytes, size: int) -> wx.Bitmap:
+    """
+    Create a square wx.Bitmap from in-memory PNG data.
+
+    The PNG data is loaded into a wx.Image and, unless it is already
+    size×size pixels, scaled using high-quality interpolation (matching the
+    C++ studio) before being converted to a wx.Bitmap. Results are cached
+    per PNG and size, so each icon is decoded and scaled only once; callers
+    share the returned bitmap and must not modify it.
+
+    Parameters
+    ----------
+    png_bytes : bytes
+        Raw PNG image data loaded into memory.
+    size : int
+        Width and height of the bitmap, in pixels.
+
+    Returns
+    -------
+    wx.Bitmap
+        A size×size bitmap, suitable for use in toolbars, trees etc.
+    """
+    image = wx.Image(BytesIO(png_bytes))
+
+    if image.GetWidth() != size or image.GetHeight() != size:
+        image = image.Scale(size, size, wx.IMAGE_QUALITY_HIGH)
+
+    return wx.Bitmap(image)
+
+
 class ImageHelpers:
     """
     Utility helper functions for working with images in a wxPython context.
@@ -17,14 +17,32 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields, is_dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 from webweaver.studio.recording.recording_event_type import RecordingEventType
 
 
-@dataclass
+def _serialise_payload_value(value):
+    """Convert a payload field value into its JSON-compatible form."""
+    if not isinstance(value, list):
+        return value
+
+    items = []
+
+    for item in value:
+        if is_dataclass(item):
+            items.append(asdict(item))
+        elif isinstance(item, dict):
+            items.append(dict(item))
+        else:
+            items.append(item)
+
+    return items
+
+
+@dataclass(slots=True)
 class BasePayload:
     """Base payload for events.
 
@@ -33,8 +51,21 @@ class BasePayload:
     """
     label: str
 
+    def to_dict(self) -> dict:
+        """Convert the payload into the dictionary stored in event["payload"].
+
+        Unlike ``dataclasses.asdict`` this does not deep-copy every field;
+        payload fields are scalars, so only list fields (e.g. send-keys
+        definitions) are copied.
+
+        Returns:
+            A new dictionary of the payload fields in declaration order.
+        """
+        return {field.name: _serialise_payload_value(getattr(self, field.name))
+                for field in fields(self)}
 
-@dataclass
+
+@dataclass(slots=True)
 class DomPayload(BasePayload):
     """Base payload for DOM-related events.
 
@@ -44,7 +75,7 @@ class DomPayload(BasePayload):
     xpath: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AssertPayload(BasePayload):
     """
     Structured payload for an assertion step.
@@ -82,7 +113,7 @@ class AssertPayload(BasePayload):
     soft_assert: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DomCheckPayload(DomPayload):
     """Payload for a DOM checkbox or toggle action.
 
@@ -94,7 +125,7 @@ class DomCheckPayload(DomPayload):
     control_type: str = "checkbox"
 
 
-@dataclass
+@dataclass(slots=True)
 class DomClickPayload(DomPayload):
     """Payload for a DOM click action.
 
@@ -104,7 +135,7 @@ class DomClickPayload(DomPayload):
     control_type: str = "click"
 
 
-@dataclass
+@dataclass(slots=True)
 class DomGetPayload(DomPayload):
     """
     Payload for a DOM_GET recording step.
@@ -130,7 +161,7 @@ class DomGetPayload(DomPayload):
     output_variable: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DomSelectPayload(DomPayload):
     """Payload for selecting an option within a DOM element.
 
@@ -142,7 +173,7 @@ class DomSelectPayload(DomPayload):
     control_type: str = "select"
 
 
-@dataclass
+@dataclass(slots=True)
 class DomTypePayload(DomPayload):
     """Payload for typing text into a DOM element.
 
@@ -154,7 +185,7 @@ class DomTypePayload(DomPayload):
     control_type: str = "text"
 
 
-@dataclass
+@dataclass(slots=True)
 class NavGotoPayload(BasePayload):
     """Payload for a navigation action.
 
@@ -164,7 +195,7 @@ class NavGotoPayload(BasePayload):
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WaitPayload(BasePayload):
     """Payload representing a timed wait step.
 
@@ -192,7 +223,7 @@ class RestApiBodyType(Enum):
     XML = 'XML'
 
 
-@dataclass
+@dataclass(slots=True)
 class RestApiPayload(BasePayload):
     """
     Represents the data required to execute a REST API request.
@@ -234,7 +265,7 @@ class RestApiPayload(BasePayload):
     body_type: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrollPayload(BasePayload):
     """
     Describes a scrolling action for UI or automation workflows.
@@ -264,7 +295,7 @@ class ScrollPayload(BasePayload):
     selector: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SendkeysKeyDefinition:
     """Represents a single key entry in a send-keys sequence.
 
@@ -288,7 +319,7 @@ class SendkeysKeyDefinition:
     modifiers: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SendkeysPayload(BasePayload):
     """Payload describing a send-keys action for an automation step.
 
@@ -307,7 +338,7 @@ class SendkeysPayload(BasePayload):
     raw_mode: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class UserVariablePayload(BasePayload):
     """Payload representing a user-defined variable recording step.
 
@@ -346,20 +377,30 @@ class RecordingDocument:
 
     This mirrors the concept of a "document" in editors like VSCode:
     the document is the file + its loaded contents, not the UI view of it.
+
+    A document may also be created with a loader instead of parsed data, in
+    which case the recording is only read and parsed the first time its
+    contents are accessed.
     """
-    __slots__ = ["_path", "_recording_data"]
+    __slots__ = ["_path", "_recording_data", "_loader"]
 
     DEFAULT_STEP_GAP_MS = 1000
 
-    def __init__(self, path: Path, recording_data: dict):
+    def __init__(self,
+                 path: Path,
+                 recording_data: Optional[dict] = None,
+                 loader: Optional[Callable[[], dict]] = None):
         """
         Create a new RecordingDocument.
 
         :param path: Path to the recording file on disk.
         :param recording_data: Parsed JSON data loaded from the recording file.
+        :param loader: Optional callable returning the parsed recording data,
+                       used to defer loading when recording_data is None.
         """
         self._path = path
         self._recording_data = recording_data
+        self._loader = loader
 
     @property
     def path(self) -> Path:
@@ -380,6 +421,10 @@ class RecordingDocument:
 
         :return: Recording data dictionary.
         """
+        if self._recording_data is None and self._loader is not None:
+            self._recording_data = self._loader()
+            self._loader = None
+
         return self._recording_data
 
     def get_step(self, index: int) -> dict:
@@ -393,7 +438,7 @@ class RecordingDocument:
         :return: The event dictionary at the given index.
         :raises IndexError: If the index is out of range.
         """
-        return self._recording_data["recording"]["events"][index]
+        return self.data["recording"]["events"][index]
 
     def delete_step(self, index: int) -> None:
         """
@@ -407,22 +452,21 @@ class RecordingDocument:
 
         :param index: Zero-based index of the step to delete.
         """
-        events = self._recording_data["recording"]["events"]
+        events = self.data["recording"]["events"]
 
         if index < 0 or index >= len(events):
             return
 
         del events[index]
 
-        # Reindex
-        for i, ev in enumerate(events):
-            ev["index"] = i
+        # Only the steps after the deleted one have shifted position.
+        self._reindex_steps(start=index, renormalise_timestamps=False)
 
     def insert_step_after(
             self,
             index: Optional[int],
             event_type: RecordingEventType,
-            payload: DomPayload,
+            payload: BasePayload,
     ) -> int:
         """Insert a new step into the recording after the given index.
 
@@ -441,7 +485,7 @@ class RecordingDocument:
         Returns:
             The index at which the new step was inserted.
         """
-        events = self._recording_data["recording"]["events"]
+        events = self.data["recording"]["events"]
         insert_index = len(events) if index is None else index + 1
         insert_index = min(insert_index, len(events))
 
@@ -449,16 +493,12 @@ class RecordingDocument:
             "index": insert_index,
             "timestamp": 11123,
             "type": event_type.value,
-            "payload": asdict(payload)
+            "payload": payload.to_dict()
         }
 
         events.insert(insert_index, event)
 
-        # Reindex
-        for i, ev in enumerate(events):
-            ev["index"] = i
-
-        self._renormalise_timestamps()
+        self._reindex_steps()
 
         return insert_index
 
@@ -469,26 +509,39 @@ class RecordingDocument:
         Args:
             new_order: List of event dicts in desired order.
         """
-        events = self._recording_data["recording"]["events"]
+        events = self.data["recording"]["events"]
 
         # Replace with new order
         events[:] = new_order
 
-        # Reindex
-        for i, ev in enumerate(events):
-            ev["index"] = i
+        self._reindex_steps()
 
-        self._renormalise_timestamps()
-
-    def _renormalise_timestamps(self) -> None:
+    def _reindex_steps(self,
+                       start: int = 0,
+                       renormalise_timestamps: bool = True) -> None:
         """
-        Renormalise step timestamps to maintain monotonic ordering
-        after structural edits (insert, delete, move).
+        Reassign the derived per-step fields after a structural edit
+        (insert, delete, move).
 
-        Timestamps are treated as derived data and are reassigned
-        sequentially based on step order.
-        """
-        events = self._recording_data["recording"]["events"]
+        Both the "index" field and, optionally, the timestamp are derived
+        from a step's position, so they are rewritten together in a single
+        pass over the event list rather than one pass per field. Steps
+        before ``start`` are left untouched.
 
-        for i, ev in enumerate(events):
-            ev["timestamp"] = i * self.DEFAULT_STEP_GAP_MS
+        Args:
+            start: Position of the first step whose fields may have changed.
+            renormalise_timestamps: If True, timestamps are reassigned
+                sequentially based on step order to keep them monotonic.
+        """
+        events = self.data["recording"]["events"]
+        step_gap_ms = self.DEFAULT_STEP_GAP_MS
+
+        if renormalise_timestamps:
+            for i in range(start, len(events)):
+                event = events[i]
+                event["index"] = i
+                event["timestamp"] = i * step_gap_ms
+
+        else:
+            for i in range(start, len(events)):
+                events[i]["index"] = i
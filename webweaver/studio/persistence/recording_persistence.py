@@ -17,10 +17,168 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import gzip
 import json
+import os
 from pathlib import Path
+import stat
+import zlib
 from webweaver.studio.persistence.recording_document import RecordingDocument
 
+# Shared codec instances reused for every load/save. json.dumps builds a new
+# encoder on each call whenever formatting options such as indent are given;
+# both objects are stateless between calls, so sharing them is thread-safe.
+_RECORDING_DECODER = json.JSONDecoder()
+_RECORDING_ENCODER = json.JSONEncoder(indent=2)
+
+RECORDING_FILE_SUFFIX = ".wwrec"
+COMPRESSED_RECORDING_FILE_SUFFIX = ".wwrec.gz"
+
+# Compression level used when writing .wwrec.gz files. Recordings are saved
+# after every edit, so favour speed; the repetitive JSON keys still compress
+# well at the lowest level.
+RECORDING_COMPRESS_LEVEL = 1
+
+
+def is_recording_file(path: Path) -> bool:
+    """
+    Check whether a path names a recording file, either plain (.wwrec) or
+    gzip-compressed (.wwrec.gz).
+
+    :param path: Path to check.
+    :return: True if the file name has a recording file extension.
+    """
+    return path.name.endswith((RECORDING_FILE_SUFFIX,
+                               COMPRESSED_RECORDING_FILE_SUFFIX))
+
+
+def recording_file_stem(path: Path) -> str:
+    """
+    Get the name of a recording file without its recording file extension.
+
+    Unlike Path.stem, this removes the whole .wwrec.gz extension of a
+    compressed recording, so both formats give the same stem.
+
+    :param path: Path to a recording file.
+    :return: The file name without .wwrec or .wwrec.gz, or the full file
+             name if it has neither extension.
+    """
+    name = path.name
+
+    for suffix in (COMPRESSED_RECORDING_FILE_SUFFIX, RECORDING_FILE_SUFFIX):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+
+    return name
+
+
+def read_recording_text(path: Path) -> str:
+    """
+    Read the JSON text of a recording file, decompressing it if the file
+    is a .wwrec.gz recording.
+
+    :param path: Path to the recording file.
+    :return: The recording JSON text.
+    :raises OSError: If the file cannot be read or decompressed.
+    """
+    raw = path.read_bytes()
+
+    if path.suffix == ".gz":
+        try:
+            raw = gzip.decompress(raw)
+        except (EOFError, zlib.error) as ex:
+            raise OSError(
+                f"Compressed recording is truncated or corrupt: {path}") from ex
+
+    return raw.decode("utf-8")
+
+
+def encode_recording_text(path: Path, text: str) -> bytes:
+    """
+    Encode recording JSON text into the bytes to be written to a recording
+    file, compressing them if the file is a .wwrec.gz recording.
+
+    :param path: Path of the recording file that will be written.
+    :param text: The recording JSON text.
+    :return: File contents to write.
+    """
+    encoded = text.encode("utf-8")
+
+    if path.suffix == ".gz":
+        encoded = gzip.compress(encoded, compresslevel=RECORDING_COMPRESS_LEVEL)
+
+    return encoded
+
+
+def write_recording_file(path: Path, data: bytes, durable: bool = True) -> None:
+    """
+    Atomically replace a recording file with new contents.
+
+    The bytes are written with a single unbuffered write to a temporary file
+    next to the recording, which then replaces the original. A failed or
+    interrupted write therefore never leaves a truncated recording behind.
+    An existing recording keeps its permission bits.
+
+    :param path: Recording file to write.
+    :param data: Complete encoded file contents, see encode_recording_text().
+    :param durable: Flush the data to stable storage before replacing the
+                    file. Without it a power loss may still lose the latest
+                    write, but never the previous contents.
+    :raises OSError: If the file cannot be written.
+    """
+    temp_path = path.with_name(f"{path.name}.tmp")
+
+    try:
+        _write_file(temp_path, data, durable)
+        _copy_file_mode(path, temp_path)
+        os.replace(temp_path, path)
+
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _copy_file_mode(source: Path, target: Path) -> None:
+    """
+    Copy the permission bits of a file onto another, if the source exists.
+
+    :param source: File whose mode is copied.
+    :param target: File to apply the mode to.
+    :raises OSError: If the mode cannot be applied.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(source).st_mode)
+    except FileNotFoundError:
+        return
+
+    os.chmod(target, mode)
+
+
+def _write_file(path: Path, data: bytes, durable: bool) -> None:
+    """
+    Write a block of bytes to a file through a raw file descriptor.
+
+    :param path: File to create or truncate.
+    :param data: Complete encoded file contents.
+    :param durable: Flush the file to stable storage once written.
+    :raises OSError: If the file cannot be written.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+
+    try:
+        remaining = memoryview(data)
+
+        while remaining:
+            written = os.write(fd, remaining)
+            remaining = remaining[written:]
+
+        if durable:
+            os.fsync(fd)
+
+    finally:
+        os.close(fd)
+
 
 class RecordingLoadError(Exception):
     """Raised when a recording file cannot be loaded."""
@@ -35,23 +193,38 @@ class RecordingPersistence:
     Persistence layer for RecordingDocument objects.
 
     Responsible for loading and saving recording documents to and from disk.
+    Recordings with a .wwrec.gz extension are transparently decompressed on
+    load and compressed on save.
     """
 
     @staticmethod
-    def load_from_disk(recording_file: Path) -> RecordingDocument:
+    def load_from_disk(recording_file: Path,
+                       lazy: bool = False) -> RecordingDocument:
         """
         Load a recording file from disk and return a RecordingDocument.
 
-        :param recording_file: Path to the .wwrec file.
+        When lazy is True the file is not read until the document data is
+        first accessed, so callers that may never look at the contents do not
+        pay for parsing the whole recording. Any load error is then raised on
+        that first access instead.
+
+        :param recording_file: Path to the .wwrec or .wwrec.gz file.
+        :param lazy: Defer reading and parsing until the data is needed.
         :return: RecordingDocument instance.
         :raises RecordingLoadError: If the file cannot be read or parsed.
         """
+        if lazy:
+            return RecordingDocument(
+                recording_file,
+                loader=lambda: RecordingPersistence.load_from_disk(
+                    recording_file).data)
+
         try:
-            text = recording_file.read_text(encoding="utf-8")
-            data = json.loads(text)
+            text = read_recording_text(recording_file)
+            data = _RECORDING_DECODER.decode(text)
             return RecordingDocument(recording_file, data)
 
-        except (OSError, json.JSONDecodeError) as ex:
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as ex:
             raise RecordingLoadError(
                 f"Failed to load recording: {recording_file}") from ex
 
@@ -60,13 +233,18 @@ class RecordingPersistence:
         """
         Save a RecordingDocument back to disk.
 
+        The recording is encoded once and written atomically with
+        write_recording_file(), so a failed save never leaves a truncated
+        recording behind.
+
         :param recording: RecordingDocument to save.
         :raises RecordingSaveError: If the file cannot be written.
         """
+        encoded = encode_recording_text(
+            recording.path, _RECORDING_ENCODER.encode(recording.data))
+
         try:
-            recording.path.write_text(
-                json.dumps(recording.data, indent=2),
-                encoding="utf-8")
+            write_recording_file(recording.path, encoded)
 
         except OSError as ex:
             raise RecordingSaveError(
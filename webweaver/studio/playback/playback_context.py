@@ -17,6 +17,7 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import functools
 from urllib.parse import urlparse, parse_qs
 import re
 
@@ -25,6 +26,44 @@ class PlaybackVariableError(Exception):
     """Raised when a required playback variable is missing."""
 
 
+_TEMPLATE_PATTERN = re.compile(r"\{\{([a-zA-Z0-9_\.\-]+)(?:\|([^}]+))?\}\}")
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_template(text: str) -> tuple:
+    """
+    Split a template string into its literal and placeholder segments.
+
+    Literal text is kept as a plain string, while each ``{{name|arg}}``
+    placeholder becomes a ``(name, arg, root, path)`` tuple, where ``root``
+    and ``path`` are the variable name split at the first dot. The result is
+    cached, so templates resolved repeatedly during playback (for example an
+    XPath inside a loop) are only scanned once.
+
+    Args:
+        text: Template string to compile.
+
+    Returns:
+        Tuple of literal strings and placeholder tuples in template order.
+    """
+    segments = []
+    position = 0
+
+    for match in _TEMPLATE_PATTERN.finditer(text):
+        if match.start() > position:
+            segments.append(text[position:match.start()])
+
+        name = match.group(1)
+        root, _, path = name.partition(".")
+        segments.append((name, match.group(2), root, path))
+        position = match.end()
+
+    if position < len(text):
+        segments.append(text[position:])
+
+    return tuple(segments)
+
+
 class PlaybackContext:
     """
     Stores and resolves runtime variables used during playback.
@@ -39,7 +78,7 @@ class PlaybackContext:
         # -> "Hello alice"
     """
 
-    _template_pattern = re.compile(r"\{\{([a-zA-Z0-9_\.\-]+)(?:\|([^}]+))?\}\}")
+    _template_pattern = _TEMPLATE_PATTERN
 
     def __init__(self, driver):
         """
@@ -66,8 +105,8 @@ class PlaybackContext:
         """
         self._variables[name] = value
 
-    def get_variable(self, name: str):
-        """Return a stored variable.
+    def __getitem__(self, name: str):
+        """Return a stored variable, e.g. ``context["username"]``.
 
         Args:
             name: Variable name.
@@ -84,9 +123,9 @@ class PlaybackContext:
             raise PlaybackVariableError(
                 f"Playback variable '{name}' was not found") from ex
 
-    def has_variable(self, name: str) -> bool:
+    def __contains__(self, name: str) -> bool:
         """
-        Check whether a variable exists.
+        Check whether a variable exists, e.g. ``"username" in context``.
 
         Args:
             name: Variable name.
@@ -96,6 +135,35 @@ class PlaybackContext:
         """
         return name in self._variables
 
+    def __iter__(self):
+        """
+        Iterate over the stored variable names, e.g. ``list(context)``.
+
+        Defined explicitly so iteration does not fall back to calling
+        ``__getitem__`` with integer indexes.
+
+        Returns:
+            An iterator over the variable names.
+        """
+        return iter(self._variables)
+
+    def get(self, name: str, default=None):
+        """
+        Return a stored variable, or a default if it does not exist.
+
+        Args:
+            name: Variable name.
+            default: Value returned when the variable is not defined.
+
+        Returns:
+            The stored variable value, or ``default``.
+        """
+        return self._variables.get(name, default)
+
+    # Method-style aliases of the subscript / membership operators.
+    get_variable = __getitem__
+    has_variable = __contains__
+
     def variables(self) -> dict[str, object]:
         """
         Return a shallow copy of all stored variables.
@@ -117,13 +185,15 @@ class PlaybackContext:
 
         This method scans the input string for template expressions matching
         the instance's template pattern and replaces them with their resolved
-        values. Resolution occurs in two ways:
+        values. The template is split into literal and placeholder segments
+        once and cached, so repeated resolution only performs the variable
+        lookups. Resolution occurs in two ways:
 
         1. **Built-in variables** – If the template name matches a registered
            built-in handler in ``self._builtins``, the corresponding callable is
            executed with the optional argument captured from the template.
         2. **User variables** – If the name is not a built-in, the value is
-           retrieved from the user-defined variables via ``self.get_variable``.
+           retrieved from the user-defined variables via ``self[name]``.
 
         Each resolved value is converted to a string before substitution.
 
@@ -136,26 +206,31 @@ class PlaybackContext:
             with their resolved values.
         """
 
-        def replace(match):
-            name = match.group(1)
-            arg = match.group(2)
+        if "{{" not in text:
+            return text
+
+        parts = []
+
+        for segment in _compile_template(text):
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+
+            name, arg, root, path = segment
 
             # Built-in variable
             if name in self._builtins:
-                value = self._builtins[name](arg)
-                return str(value)
-
-            # Split root + path
-            root, *rest = name.split(".")
+                parts.append(str(self._builtins[name](arg)))
+                continue
 
-            value = self.get_variable(root)
+            value = self[root]
 
-            if rest:
-                value = self._resolve_variable_path(value, ".".join(rest))
+            if path:
+                value = self._resolve_variable_path(value, path)
 
-            return str(value)
+            parts.append(str(value))
 
-        return self._template_pattern.sub(replace, text)
+        return "".join(parts)
 
     def _builtin_current_url(self, _arg=None):
         return self._driver.current_url
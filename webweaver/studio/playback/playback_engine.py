@@ -19,9 +19,10 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import asyncio
 import json
+import logging
 from logging import Logger
 import threading
-from typing import Callable, Dict
+from typing import Callable, Dict, List, Tuple
 import keyboard
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
@@ -33,6 +34,10 @@ from webweaver.studio.browsing.studio_browser import (PlaybackStepResult,
 from webweaver.studio.persistence.recording_document import RestApiBodyType
 from webweaver.studio.playback.playback_context import (PlaybackContext,
                                                         PlaybackVariableError)
+from webweaver.studio.playback.playback_event_decoding import (
+    EMPTY_PAYLOAD,
+    decode_scroll_payload,
+    handle_invalid_scroll)
 from webweaver.studio.recording.recording import Recording
 from webweaver.common.assertion import Assertions, AssertionFailure
 from webweaver.common.assertion_operator import (AssertionOperator,
@@ -41,6 +46,8 @@ from webweaver.common.assertion_operator import (AssertionOperator,
                                                  ASSERTION_BOOLEAN_OPERATORS,
                                                  ASSERTION_EXISTENCE_OPERATORS)
 
+EventHandler = Callable[[dict], PlaybackStepResult]
+
 
 class PlaybackEngine:
     """
@@ -103,10 +110,21 @@ class PlaybackEngine:
             _event_handlers_map (Dict[str, Callable[[dict], PlaybackStepResult]]):
                 Mapping of event type strings to their corresponding handler
                 methods.
+            _debug_enabled (bool): Whether debug logging was enabled when the
+                engine was created.
+            _api_client (ApiClient): HTTP client shared by REST API steps.
+            _api_loop (asyncio.AbstractEventLoop | None): Event loop used to
+                run REST API calls, created on first use.
         """
         self._browser = browser
         self._recording = recording
         self._logger = logger.getChild(__name__)
+
+        # Resolved once per engine (i.e. per playback run) so hot handlers can
+        # skip the logging call, and building its arguments, when debug
+        # output is disabled.
+        self._debug_enabled: bool = self._logger.isEnabledFor(logging.DEBUG)
+
         self._context = PlaybackContext(self._browser.raw)
         self._hard_assert: Assertions = Assertions(soft=False,
                                                    logger=self._logger)
@@ -114,8 +132,14 @@ class PlaybackEngine:
                                                    logger=self._logger)
         self._stop_event = threading.Event()
 
-        self._event_handlers_map: Dict[
-            str, Callable[[dict], PlaybackStepResult]] = {
+        # REST API steps share one client (and its connection pool) and one
+        # event loop for the whole run instead of creating both per call.
+        # The loop is created on first use so it belongs to the playback
+        # thread, and is released by close().
+        self._api_client: ApiClient = ApiClient(persistent_session=True)
+        self._api_loop: asyncio.AbstractEventLoop | None = None
+
+        self._event_handlers_map: Dict[str, EventHandler] = {
             "assert": self._handle_assert,
             "dom.check": self._handle_dom_check,
             "dom.click": self._handle_dom_click,
@@ -154,6 +178,23 @@ class PlaybackEngine:
         """
         return self._context
 
+    def close(self):
+        """
+        Release the resources held for REST API steps.
+
+        Closes the shared HTTP session and its event loop. This must be called
+        from the thread that ran the playback steps, once they have finished.
+        The engine stays usable afterwards and recreates both on demand.
+        """
+        if self._api_loop is None:
+            return
+
+        try:
+            self._api_loop.run_until_complete(self._api_client.close())
+        finally:
+            self._api_loop.close()
+            self._api_loop = None
+
     def execute_event(self, event: dict):
         """
         Execute a single playback event.
@@ -171,23 +212,89 @@ class PlaybackEngine:
         Returns:
             PlaybackStepResult: The result of executing the event.
         """
-        try:
-            event_type = event.get("type")
-            payload = event.get("payload", {})
+        handler, payload = self.decode_event(event)
+        return self.execute_decoded_event(handler, payload)
+
+    def decode_event(self, event: dict) -> Tuple[EventHandler, dict]:
+        """
+        Resolve the handler and payload of an event ahead of execution.
 
-            handler = self._event_handlers_map.get(event_type)
+        Decoding a whole recording once before playback means the per-step
+        work is reduced to calling the handler, rather than repeating the
+        type lookup and payload extraction every time a step is executed.
+        Unknown event types decode to a no-op handler that always succeeds.
 
-            if handler is None:
+        Args:
+            event (dict): The event to decode. Must contain a "type" key and
+                optionally a "payload" dictionary.
+
+        Returns:
+            Tuple[EventHandler, dict]: The bound handler and the event payload.
+        """
+        event_type = event.get("type")
+        handler = self._event_handlers_map.get(event_type)
+
+        if handler is None:
+            if self._debug_enabled:
                 self._logger.debug("[PLAYBACK EVENT] Unknown event: %s",
                                    event_type)
-                return PlaybackStepResult.success()
+            handler = self._handle_unknown
+
+        payload = event.get("payload") or EMPTY_PAYLOAD
+
+        if event_type == "scroll":
+            try:
+                payload = decode_scroll_payload(payload)
+
+            except (TypeError, ValueError):
+                handler = handle_invalid_scroll
+
+        return handler, payload
+
+    def decode_events(self,
+                      events: List[dict]) -> List[Tuple[EventHandler, dict]]:
+        """
+        Decode a sequence of events with ``decode_event``.
+
+        Args:
+            events (List[dict]): The events to decode, in playback order.
+
+        Returns:
+            List[Tuple[EventHandler, dict]]: One (handler, payload) pair per
+            event.
+        """
+        return [self.decode_event(event) for event in events]
+
+    def execute_decoded_event(self, handler: EventHandler, payload: dict):
+        """
+        Execute an event previously decoded with ``decode_event``.
 
+        This method is crash-safe: any exception raised during execution is
+        caught and returned as a failed PlaybackStepResult.
+
+        Args:
+            handler (EventHandler): Handler returned by ``decode_event``.
+            payload (dict): Payload returned by ``decode_event``.
+
+        Returns:
+            PlaybackStepResult: The result of executing the event.
+        """
+        try:
             return handler(payload)
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             self._logger.exception("Playback event crashed")
             return PlaybackStepResult.fail(str(e))
 
+    def _handle_unknown(self, _payload):
+        """
+        Handle an event of an unknown type as a successful no-op.
+
+        Returns:
+            PlaybackStepResult: Always successful.
+        """
+        return PlaybackStepResult.success()
+
     #  --- Assertion Event ---
 
     def _handle_assert(self, payload):
@@ -451,7 +558,9 @@ class PlaybackEngine:
         Returns:
             PlaybackStepResult: Result containing retrieved data.
         """
-        self._logger.debug("[PLAYBACK EVENT] Element Get: %s", payload)
+        if self._debug_enabled:
+            self._logger.debug("[PLAYBACK EVENT] Element Get: %s", payload)
+
         return self._browser.playback_get(payload, self._context)
 
     #  --- DOM element select ---
@@ -484,7 +593,9 @@ class PlaybackEngine:
         updated_payload["xpath"] = xpath
         updated_payload["value"] = value
 
-        self._logger.debug("[PLAYBACK EVENT] Text: %s", updated_payload)
+        if self._debug_enabled:
+            self._logger.debug("[PLAYBACK EVENT] Text: %s", updated_payload)
+
         return self._browser.playback_select(updated_payload)
 
     #  --- DOM element type ---
@@ -517,7 +628,9 @@ class PlaybackEngine:
         updated_payload["xpath"] = xpath
         updated_payload["value"] = value
 
-        self._logger.debug("[PLAYBACK EVENT] Type: %s", updated_payload)
+        if self._debug_enabled:
+            self._logger.debug("[PLAYBACK EVENT] Type: %s", updated_payload)
+
         return self._browser.playback_type(updated_payload)
 
     #  --- DOM element type ---
@@ -532,7 +645,8 @@ class PlaybackEngine:
             PlaybackStepResult: Success if navigation succeeds, otherwise failure.
         """
         url: str = payload.get("url")
-        self._logger.debug("[PLAYBACK EVENT] Navigate to '%s'", url)
+        if self._debug_enabled:
+            self._logger.debug("[PLAYBACK EVENT] Navigate to '%s'", url)
 
         try:
             self._browser.open_page(url)
@@ -583,8 +697,6 @@ class PlaybackEngine:
                 return PlaybackStepResult.fail(
                     f"REST API body variable '{call_body}' is not defined")
 
-        api_client = ApiClient()
-
         body_type = RestApiBodyType[body_type.upper()]
         call_url = f"{base_url}{rest_call}"
 
@@ -593,21 +705,23 @@ class PlaybackEngine:
             # Perform HTTP call
             # -----------------------------
             if call_type == "get":
-                response = asyncio.run(api_client.call_api_get(url=call_url))
+                response = self._run_api_call(
+                    self._api_client.call_api_get(url=call_url))
 
             elif call_type == "post":
-                response = asyncio.run(api_client.call_api_post(
+                response = self._run_api_call(self._api_client.call_api_post(
                     url=call_url, body=call_body, body_type=body_type))
 
-                print(f"Response: Status = {response.status_code} | Body: {response.body}")
-
             elif call_type == "delete":
-                response = asyncio.run(api_client.call_api_delete(url=call_url))
+                response = self._run_api_call(
+                    self._api_client.call_api_delete(url=call_url))
 
             else:
                 return PlaybackStepResult.fail(
                     f"Unknown REST call type '{call_type}'")
 
+            self._log_rest_api_response(response)
+
             # -----------------------------
             # Store result in context
             # -----------------------------
@@ -640,6 +754,33 @@ class PlaybackEngine:
             # OSError / TimeoutError -> network-related failures
             return PlaybackStepResult.fail(str(e))
 
+    def _log_rest_api_response(self, response):
+        """
+        Log the status and body of a REST API response at debug level.
+
+        Args:
+            response (ApiResponse): The response returned by the ApiClient.
+        """
+        if self._debug_enabled:
+            self._logger.debug(
+                "[PLAYBACK EVENT] REST API response: status=%s body=%s",
+                response.status_code, response.body)
+
+    def _run_api_call(self, coroutine):
+        """
+        Run an ApiClient coroutine to completion on the engine's event loop.
+
+        Args:
+            coroutine: The ApiClient call to run.
+
+        Returns:
+            ApiResponse: The result of the call.
+        """
+        if self._api_loop is None:
+            self._api_loop = asyncio.new_event_loop()
+
+        return self._api_loop.run_until_complete(coroutine)
+
     #  --- Page Scroll ---
     def _handle_scroll(self, payload):
         """
@@ -649,14 +790,15 @@ class PlaybackEngine:
         or a custom offset.
 
         Args:
-            payload (dict): Scroll configuration.
+            payload (dict): Scroll configuration, with integer offsets as
+                produced by ``decode_event``.
 
         Returns:
             PlaybackStepResult: Result of the scroll operation.
         """
         scroll_type = payload.get("scroll_type")
-        scroll_x = payload.get("x_scroll", 0)
-        scroll_y = payload.get("y_scroll", 0)
+        scroll_x = payload["x_scroll"]
+        scroll_y = payload["y_scroll"]
         selector = payload.get("selector", "")
 
         element = None
@@ -682,7 +824,7 @@ class PlaybackEngine:
             elif scroll_type == "custom":
                 self._browser.raw.execute_script("""
                     arguments[0].scrollTop += arguments[1];
-                """, element, int(scroll_y))
+                """, element, scroll_y)
 
             return PlaybackStepResult.success()
 
@@ -694,7 +836,7 @@ class PlaybackEngine:
             self._browser.scroll_to_top()
 
         elif scroll_type == "custom":
-            self._browser.scroll_to(int(scroll_x), int(scroll_y))
+            self._browser.scroll_to(scroll_x, scroll_y)
 
         return PlaybackStepResult.success()
 
@@ -0,0 +1,63 @@
+"""
+This source file is part of Web Weaver
+For the latest info, see https://github.com/SwatKat1977/WebWeaver
+
+Copyright 2025-2026 Webweaver Development Team
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from types import MappingProxyType
+from webweaver.studio.browsing.studio_browser import PlaybackStepResult
+
+# Shared read-only payload for events recorded without one, so decoding them
+# does not allocate a new empty dict each time.
+EMPTY_PAYLOAD = MappingProxyType({})
+
+
+def decode_scroll_payload(payload: dict) -> dict:
+    """
+    Return a copy of a scroll payload with its offsets converted to int.
+
+    Recordings may store the offsets as strings or leave them unset, so
+    they are converted once when the recording is decoded rather than on
+    every execution.
+
+    Args:
+        payload (dict): Scroll configuration as stored in the recording.
+
+    Returns:
+        dict: Scroll configuration with integer "x_scroll"/"y_scroll".
+
+    Raises:
+        TypeError, ValueError: If an offset is not a valid integer.
+    """
+    decoded = dict(payload)
+    decoded["x_scroll"] = int(payload.get("x_scroll") or 0)
+    decoded["y_scroll"] = int(payload.get("y_scroll") or 0)
+    return decoded
+
+
+def handle_invalid_scroll(payload: dict) -> PlaybackStepResult:
+    """
+    Handle a scroll event whose offsets could not be decoded.
+
+    Args:
+        payload (dict): Scroll configuration as stored in the recording.
+
+    Returns:
+        PlaybackStepResult: Always a failure.
+    """
+    return PlaybackStepResult.fail(
+        f"Invalid scroll offset x='{payload.get('x_scroll')}', "
+        f"y='{payload.get('y_scroll')}'")
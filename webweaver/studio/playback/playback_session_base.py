@@ -17,6 +17,8 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 import datetime
 import logging
 import os
@@ -31,6 +33,7 @@ from webweaver.studio.recording.recording import Recording
 from webweaver.studio.studio_solution import StudioSolution, ScreenshotPolicy
 
 
+@dataclass(slots=True)
 class PlaybackCallbackEvents:
     """
     Container for optional playback lifecycle callbacks.
@@ -58,10 +61,10 @@ class PlaybackCallbackEvents:
         or because playback stopped due to a failure.
     """
     # pylint: disable=too-few-public-methods
-    on_step_started: typing.Callable[[int], None] = None
-    on_step_passed: typing.Callable[[int], None] = None
-    on_step_failed: typing.Callable[[int], None] = None
-    on_playback_finished: typing.Callable[[int], None] = None
+    on_step_started: typing.Optional[typing.Callable[[int], None]] = None
+    on_step_passed: typing.Optional[typing.Callable[[int], None]] = None
+    on_step_failed: typing.Optional[typing.Callable[[int], None]] = None
+    on_playback_finished: typing.Optional[typing.Callable[[int], None]] = None
 
 
 class PlaybackSessionBase:
@@ -77,6 +80,7 @@ class PlaybackSessionBase:
 
     Attributes:
         _index (int): The current step index being executed.
+        _step_count (int): Number of steps in the current run.
         _running (bool): Indicates whether playback is currently active.
         _thread (Optional[threading.Thread]): Background thread running playback.
         _logger (logging.Logger): Logger scoped to the subclass name.
@@ -111,6 +115,16 @@ class PlaybackSessionBase:
             Executes a single step. Returns True if execution should continue,
             or False if playback should stop.
 
+        step_batch(max_steps: int) -> bool:
+            Executes up to ``max_steps`` steps, stopping early on failure or
+            completion. The playback loop runs steps in batches of
+            ``PLAYBACK_BATCH_SIZE`` to amortise its per-iteration overhead.
+
+        fast_forward(steps: int):
+            Requests a skip of the next ``steps`` steps. The playback thread
+            runs them before its next batch without per-step callbacks or
+            screenshots, reporting only the final step (or a failure).
+
     Subclass Responsibilities:
         Subclasses must implement the following methods:
 
@@ -125,6 +139,10 @@ class PlaybackSessionBase:
     """
     # pylint: disable=too-many-instance-attributes
 
+    # Number of steps the playback loop executes back-to-back before briefly
+    # yielding to other threads (e.g. the UI thread).
+    PLAYBACK_BATCH_SIZE = 8
+
     def __init__(self,
                  logger: logging.Logger,
                  solution: StudioSolution,
@@ -137,14 +155,18 @@ class PlaybackSessionBase:
                 for this playback session instance.
         """
         self._index = 0
+        self._step_count = 0
         self._running = False
         self._thread = None
+        self._pending_skip = 0
+        self._skip_lock = threading.Lock()
         self._logger = logger.getChild(self.__class__.__name__)
         self._solution: StudioSolution = solution
         self._recording: Recording = recording
         self.callback_events = PlaybackCallbackEvents()
         self._run_start_time: int = 0
         self._screenshots_dir: Path | None = None
+        self._screenshot_writer: ThreadPoolExecutor | None = None
         self._web_browser: StudioBrowser = web_browser
 
         # As recording-level screenshot policy fidelity isn't implemented, the
@@ -168,6 +190,9 @@ class PlaybackSessionBase:
 
         self._running = True
         self._index = 0
+
+        with self._skip_lock:
+            self._pending_skip = 0
         self._run_start_time = int(time.time())
 
         if self._screenshot_policy != ScreenshotPolicy.OFF:
@@ -202,6 +227,19 @@ class PlaybackSessionBase:
                     wx.ICON_INFORMATION)
                 return
 
+        if self._screenshot_policy in [ScreenshotPolicy.ALL_STEPS.value,
+                                       ScreenshotPolicy.ON_FAILURE.value]:
+            # Screenshot files are written in the background so disk I/O
+            # overlaps with executing the following steps.
+            self._screenshot_writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="PlaybackScreenshots")
+
+        self._on_start()
+
+        # Steps cannot change while a run is in progress, so the count is
+        # resolved once here rather than on every step.
+        self._step_count = self._get_step_count()
+
         self._thread = threading.Thread(
             target=self._playback_loop,
             daemon=True
@@ -229,22 +267,25 @@ class PlaybackSessionBase:
         if not self._running:
             return False
 
-        if self._index >= self._get_step_count():
+        current_index = self._index
+
+        if current_index >= self._step_count:
             self.stop()
             return False
 
-        current_index = self._index
+        callbacks = self.callback_events
+        on_step_started = callbacks.on_step_started
+        on_step_passed = callbacks.on_step_passed
+        on_step_failed = callbacks.on_step_failed
 
-        if self.callback_events.on_step_started:
-            wx.CallAfter(self.callback_events.on_step_started, current_index)
+        if on_step_started:
+            wx.CallAfter(on_step_started, current_index)
 
         result = self._execute_step(current_index)
 
         if not result.ok:
-            if self.callback_events.on_step_failed:
-                wx.CallAfter(self.callback_events.on_step_failed,
-                             current_index,
-                             result.error)
+            if on_step_failed:
+                wx.CallAfter(on_step_failed, current_index, result.error)
 
                 if self._screenshot_policy in [ScreenshotPolicy.ALL_STEPS.value,
                                                ScreenshotPolicy.ON_FAILURE.value]:
@@ -256,12 +297,92 @@ class PlaybackSessionBase:
         if self._screenshot_policy in [ScreenshotPolicy.ALL_STEPS.value]:
             self._perform_screenshot(current_index + 1)
 
-        if self.callback_events.on_step_passed:
-            wx.CallAfter(self.callback_events.on_step_passed, current_index)
+        if on_step_passed:
+            wx.CallAfter(on_step_passed, current_index)
 
         self._index += 1
         return True
 
+    def step_batch(self, max_steps: int) -> bool:
+        """Executes up to ``max_steps`` playback steps in a single call.
+
+        Steps are run back-to-back with the same callbacks as ``step()``, so
+        per-step UI updates are unaffected; only the per-call overhead of
+        the playback loop is amortised across the batch. The batch ends
+        early if a step fails or playback stops or completes.
+
+        Args:
+            max_steps (int): Maximum number of steps to execute.
+
+        Any skip requested through ``fast_forward()`` is carried out before
+        the batch starts.
+
+        Returns:
+            bool: True if playback should continue, False otherwise.
+        """
+        if self._pending_skip and not self._skip_pending_steps():
+            return False
+
+        for _ in range(max_steps):
+            if not self.step():
+                return False
+
+        return True
+
+    def fast_forward(self, steps: int) -> None:
+        """Requests that playback skips ahead by ``steps`` steps.
+
+        Safe to call from any thread: the request is only recorded here and
+        is carried out by the playback thread before its next batch, so it
+        never runs concurrently with the playback loop. Repeated requests
+        accumulate.
+
+        Args:
+            steps (int): Number of steps to advance by. It is clamped to the
+                number of steps remaining when the skip is carried out.
+        """
+        if steps <= 0:
+            return
+
+        with self._skip_lock:
+            self._pending_skip += steps
+
+    def _skip_pending_steps(self) -> bool:
+        """Executes the steps requested through ``fast_forward()``.
+
+        Unlike ``step_batch()``, the intermediate steps do not fire callbacks
+        or take screenshots; only the final step reports started/passed. A
+        failing step is reported through ``on_step_failed`` as usual and
+        stops playback.
+
+        Returns:
+            bool: True if playback should continue, False otherwise.
+        """
+        with self._skip_lock:
+            steps = self._pending_skip
+            self._pending_skip = 0
+
+        end_index = min(self._index + steps, self._step_count)
+        execute_step = self._execute_step
+
+        while self._index < end_index - 1:
+            if not self._running:
+                return False
+
+            result = execute_step(self._index)
+
+            if not result.ok:
+                if self.callback_events.on_step_failed:
+                    wx.CallAfter(self.callback_events.on_step_failed,
+                                 self._index, result.error)
+                self.stop()
+                return False
+
+            self._index += 1
+
+        # The last step goes through step() so it reports progress normally.
+        return self.step()
+
     def _playback_loop(self):
         """Internal playback loop executed on a background thread.
 
@@ -271,13 +392,19 @@ class PlaybackSessionBase:
 
         try:
             while self._running:
-                if not self.step():
+                if not self.step_batch(self.PLAYBACK_BATCH_SIZE):
                     break
                 time.sleep(0.001)
         finally:
+            self._on_finished()
             self._running = False
             self._thread = None
 
+            # Make sure every screenshot is on disk before reporting the end.
+            if self._screenshot_writer:
+                self._screenshot_writer.shutdown(wait=True)
+                self._screenshot_writer = None
+
             if self.callback_events.on_playback_finished:
                 wx.CallAfter(self.callback_events.on_playback_finished)
 
@@ -313,12 +440,23 @@ class PlaybackSessionBase:
         """
         raise NotImplementedError
 
+    def _on_start(self):
+        """Optional override for subclasses, called before playback begins"""
+
     def _on_stop(self):
         """Optional override for subclasses"""
 
+    def _on_finished(self):
+        """Optional override for subclasses, called on the playback thread
+        once the playback loop has exited"""
+
     def _perform_screenshot(self, step_index: int) -> None:
         """Capture a screenshot for the current step.
 
+        The image is captured from the browser synchronously, so it reflects
+        the state after this step, but written to disk on the screenshot
+        writer thread.
+
         Args:
             step_index (int): The index of the step being executed.
         """
@@ -330,7 +468,13 @@ class PlaybackSessionBase:
             filename = self._sanitised_filename(filename)
             filepath = os.path.join(self._screenshots_dir, filename)
 
-            self._web_browser.raw.save_screenshot(filepath)
+            image = self._web_browser.raw.get_screenshot_as_png()
+
+            if self._screenshot_writer:
+                self._screenshot_writer.submit(self._write_screenshot,
+                                               filepath, image, step_index)
+            else:
+                self._write_screenshot(filepath, image, step_index)
 
         except Exception as ex:
             # Never break playback because of screenshots
@@ -338,6 +482,26 @@ class PlaybackSessionBase:
                 "Failed to create screenshot for '%s', step %d. Reason: %s",
                 self._recording.metadata.name, step_index, str(ex))
 
+    def _write_screenshot(self,
+                          filepath: str,
+                          image: bytes,
+                          step_index: int) -> None:
+        """Write a captured screenshot image to disk.
+
+        Args:
+            filepath (str): Destination PNG file path.
+            image (bytes): PNG image data.
+            step_index (int): The index of the step the screenshot is for.
+        """
+        try:
+            with open(filepath, "wb") as file:
+                file.write(image)
+
+        except OSError as ex:
+            self._logger.error(
+                "Failed to create screenshot for '%s', step %d. Reason: %s",
+                self._recording.metadata.name, step_index, str(ex))
+
     def _sanitised_filename(self, name: str) -> str:
         # Replace invalid characters with underscore
         sanitised = re.sub(r'[<>:"/\\|?*\x00-\x1F]+', '_', name)
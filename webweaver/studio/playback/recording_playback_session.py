@@ -19,7 +19,8 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 from logging import Logger
 from webweaver.studio.browsing.studio_browser import StudioBrowser
-from webweaver.studio.playback.playback_engine import PlaybackEngine
+from webweaver.studio.playback.playback_engine import (EventHandler,
+                                                       PlaybackEngine)
 from webweaver.studio.playback.playback_session_base import PlaybackSessionBase
 from webweaver.studio.recording.recording import Recording
 from webweaver.studio.studio_solution import StudioSolution
@@ -50,12 +51,24 @@ class RecordingPlaybackSession(PlaybackSessionBase):
                                                       recording,
                                                       logger)
 
+        # (handler, payload) pairs decoded once per run in _on_start().
+        self._decoded_events: list[tuple[EventHandler, dict]] = []
+
+    def _on_start(self):
+        # Re-arm interruptible waits in case this session was stopped before.
+        self._engine.stop_event.clear()
+        self._decoded_events = self._engine.decode_events(
+            self._recording.events)
+
     def _get_step_count(self) -> int:
-        return len(self._recording.events)
+        return len(self._decoded_events)
 
     def _execute_step(self, index: int):
-        event = self._recording.events[index]
-        return self._engine.execute_event(event)
+        handler, payload = self._decoded_events[index]
+        return self._engine.execute_decoded_event(handler, payload)
 
     def _on_stop(self):
         self._engine.stop_event.set()
+
+    def _on_finished(self):
+        self._engine.close()
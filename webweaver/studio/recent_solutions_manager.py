@@ -17,6 +17,7 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+from collections import OrderedDict
 import json
 from pathlib import Path
 import wx
@@ -52,7 +53,12 @@ class RecentSolutionsManager:
 
         Call :meth:`load` to populate the list from persistent storage.
         """
-        self._recent: list[Path] = []
+        # Keys are the solution paths, most recent first; values are unused.
+        self._recent: OrderedDict[Path, None] = OrderedDict()
+
+        # Resolved on first use, as the user config directory never changes
+        # for the lifetime of the application.
+        self._storage_path: Path | None = None
 
     def load(self) -> None:
         """
@@ -77,7 +83,7 @@ class RecentSolutionsManager:
 
         entries = j.get("recentSolutions", [])
         for entry in entries:
-            self._recent.append(Path(entry))
+            self._recent[Path(entry)] = None
 
     def save(self) -> None:
         """
@@ -104,7 +110,8 @@ class RecentSolutionsManager:
         If the solution already exists in the list, it is moved to the front.
         The list is truncated to :data:`MAX_RECENT` entries if necessary.
 
-        This method automatically saves the updated list to disk.
+        This method automatically saves the updated list to disk, unless the
+        solution is already the most recent entry.
 
         Parameters
         ----------
@@ -113,15 +120,17 @@ class RecentSolutionsManager:
         """
         path = Path(solution_path)
 
-        # Remove if already present
-        self._recent = [p for p in self._recent if p != path]
+        # Already the most recent entry, so there is nothing to update
+        if next(iter(self._recent), None) == path:
+            return
 
-        # Insert at front
-        self._recent.insert(0, path)
+        # Add if not already present, then move to the front
+        self._recent[path] = None
+        self._recent.move_to_end(path, last=False)
 
         # Truncate if larger then max size
-        if len(self._recent) > self.MAX_RECENT:
-            self._recent = self._recent[: self.MAX_RECENT]
+        while len(self._recent) > self.MAX_RECENT:
+            self._recent.popitem(last=True)
 
         self.save()
 
@@ -134,8 +143,11 @@ class RecentSolutionsManager:
         Path
             Path to the JSON file used to store the recent solutions list.
         """
-        base_dir = Path(wx.StandardPaths.Get().GetUserConfigDir())
-        return base_dir / "webweaver" / "recent_solutions.json"
+        if self._storage_path is None:
+            base_dir = Path(wx.StandardPaths.Get().GetUserConfigDir())
+            self._storage_path = base_dir / "webweaver" / "recent_solutions.json"
+
+        return self._storage_path
 
     def get_solutions(self) -> list[Path]:
         """
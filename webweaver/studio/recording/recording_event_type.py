@@ -44,6 +44,12 @@ class RecordingEventType(enum.Enum):
     UNKNOWN = "unknown"
 
 
+# Serialized event type string -> RecordingEventType, built once on import.
+_EVENT_TYPES_BY_VALUE: dict[str, RecordingEventType] = {
+    event_type.value: event_type for event_type in RecordingEventType
+}
+
+
 def event_type_from_str(value: str) -> RecordingEventType:
     """
     Convert a string value into a :class:`RecordingEventType`.
@@ -65,40 +71,7 @@ def event_type_from_str(value: str) -> RecordingEventType:
         The corresponding enum value, or :data:`RecordingEventType.UNKNOWN`
         if the string is not recognized.
     """
-
-    event_type: RecordingEventType = RecordingEventType.UNKNOWN
-
-    if value == "assert":
-        event_type = RecordingEventType.ASSERT
-
-    if value == "dom.check":
-        event_type = RecordingEventType.DOM_CHECK
-
-    elif value == "dom.click":
-        event_type = RecordingEventType.DOM_CLICK
-
-    elif value == "nav.goto":
-        event_type = RecordingEventType.NAV_GOTO
-
-    elif value == "dom.select":
-        event_type = RecordingEventType.DOM_SELECT
-
-    elif value == "dom.type":
-        event_type = RecordingEventType.DOM_TYPE
-
-    elif value == "rest_api":
-        event_type = RecordingEventType.REST_API
-
-    elif value == "sendkeys":
-        event_type = RecordingEventType.SENDKEYS
-
-    elif value == "scroll":
-        event_type = RecordingEventType.SCROLL
-
-    elif value == "wait":
-        event_type = RecordingEventType.WAIT
-
-    return event_type
+    return _EVENT_TYPES_BY_VALUE.get(value, RecordingEventType.UNKNOWN)
 
 
 def event_type_to_str(event_type: RecordingEventType) -> str:
@@ -18,8 +18,11 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 import json
+from pathlib import Path
 from typing import Optional
 
+from webweaver.studio.persistence.recording_persistence import \
+    read_recording_text
 from webweaver.studio.recording_metadata import RecordingMetadata
 from webweaver.studio.recording_view_context import RecordingViewContext
 from webweaver.studio.recording.recording import Recording
@@ -30,8 +33,7 @@ def load_recording_from_context(ctx: RecordingViewContext) -> Optional[Recording
     Load a full recording (metadata + events) from disk.
     """
     try:
-        with ctx.recording_file.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(read_recording_text(ctx.recording_file))
     except (OSError, json.JSONDecodeError):
         return None
 
@@ -53,8 +55,7 @@ def load_recording(metadata: RecordingMetadata) -> Optional[Recording]:
     Load a full recording (metadata + events) from disk.
     """
     try:
-        with open(metadata.file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(read_recording_text(Path(metadata.file_path)))
 
     except (OSError, json.JSONDecodeError):
         return None
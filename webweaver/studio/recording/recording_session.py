@@ -17,15 +17,47 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import json
+import logging
 from pathlib import Path
 import time
 import typing
 import uuid
+from webweaver.studio.persistence.recording_persistence import (
+    RecordingLoadError,
+    encode_recording_text,
+    read_recording_text,
+    write_recording_file)
 from webweaver.studio.recording.recording_event_type import RecordingEventType
 from webweaver.studio.studio_solution import StudioSolution
 
+# Stand-in for the events list when encoding the rest of the recording; the
+# already-encoded events are spliced in where it appears.
+_EVENTS_PLACEHOLDER: str = f"__webweaver_events_{uuid.uuid4().hex}__"
+
+# Indentation of an event object inside the recording file, i.e. three levels
+# deep (document -> "recording" -> "events").
+_EVENT_INDENT: str = " " * 12
+
+# Serialised event types checked on every append_event() call.
+_DOM_CLICK_EVENT_TYPE: str = RecordingEventType.DOM_CLICK.value
+
+# Event types that make an immediately preceding click on the same element
+# redundant.
+_CLICK_SUPERSEDING_EVENT_TYPES: typing.FrozenSet[str] = frozenset({
+    RecordingEventType.DOM_SELECT.value,
+    RecordingEventType.DOM_CHECK.value,
+})
+
+# Event types where consecutive events on the same element are merged.
+_COALESCED_EVENT_TYPES: typing.FrozenSet[str] = frozenset({
+    RecordingEventType.DOM_TYPE.value,
+    RecordingEventType.DOM_SELECT.value,
+    RecordingEventType.DOM_CHECK.value,
+})
+
 
 def now_utc_iso() -> str:
     """
@@ -46,6 +78,113 @@ def now_utc_iso() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H-%M-%S")
 
 
+class _SnapshotWriter:
+    """
+    Writes recording file snapshots for a RecordingSession.
+
+    Snapshots can be written immediately or queued for a single background
+    thread, so a slow disk never stalls the thread capturing events. Only the
+    most recently queued snapshot is written; older ones still waiting in the
+    queue are skipped. A failed background write is logged and kept in
+    :attr:`error`.
+    """
+
+    def __init__(self, durable: bool, logger: logging.Logger):
+        """
+        Create a new snapshot writer.
+
+        Parameters
+        ----------
+        durable : bool
+            Flush every write to stable storage.
+        logger : logging.Logger
+            Logger used to report background write failures.
+        """
+        self._durable: bool = durable
+        self._logger: logging.Logger = logger
+        self._executor: typing.Optional[ThreadPoolExecutor] = None
+        self._generation: int = 0
+        self._error: typing.Optional[str] = None
+
+    @property
+    def error(self) -> typing.Optional[str]:
+        """ Get the error from a failed background write, or None """
+        return self._error
+
+    def start(self) -> None:
+        """
+        Start the background thread used by :meth:`submit`.
+        """
+        self._error = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="RecordingWriter")
+
+    def stop(self) -> None:
+        """
+        Stop the background thread, waiting for queued writes.
+        """
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def write(self, path: Path, data: bytes) -> None:
+        """
+        Write a snapshot immediately, on the calling thread.
+
+        Parameters
+        ----------
+        path : Path
+            The recording file to replace.
+        data : bytes
+            Encoded recording file contents.
+
+        Raises
+        ------
+        OSError
+            If the file could not be written.
+        """
+        write_recording_file(path, data, self._durable)
+
+    def submit(self, path: Path, data: bytes) -> None:
+        """
+        Queue a snapshot to be written on the background thread.
+
+        Parameters
+        ----------
+        path : Path
+            The recording file to replace.
+        data : bytes
+            Encoded recording file contents.
+        """
+        self._generation += 1
+        self._executor.submit(self._write_queued, path, data, self._generation)
+
+    def _write_queued(self, path: Path, data: bytes, generation: int) -> None:
+        """
+        Write a snapshot queued by :meth:`submit`, on the background thread.
+
+        Parameters
+        ----------
+        path : Path
+            The recording file to replace.
+        data : bytes
+            Encoded recording file contents.
+        generation : int
+            Write generation of the snapshot.
+        """
+        # A newer snapshot is already queued behind this one.
+        if generation != self._generation:
+            return
+
+        try:
+            self.write(path, data)
+
+        except OSError as ex:
+            self._logger.error("Failed to write recording file '%s': %s",
+                               path, ex)
+            self._error = f"Failed to write recording file:\n{ex}"
+
+
 class RecordingSession:
     """
     Manages a live recording session for a solution.
@@ -57,8 +196,12 @@ class RecordingSession:
     A recording session is started with :meth:`start`, populated with events
     using :meth:`append_event`, and finalized using :meth:`stop`.
     """
+    # pylint: disable=too-many-instance-attributes
 
-    def __init__(self, solution: StudioSolution):
+    def __init__(self,
+                 solution: StudioSolution,
+                 durable_writes: bool = True,
+                 logger: typing.Optional[logging.Logger] = None):
         """
         Create a new RecordingSession.
 
@@ -66,20 +209,57 @@ class RecordingSession:
         ----------
         solution : StudioSolution
             The solution for which this recording session is created.
+        durable_writes : bool
+            Flush every write of the recording file to stable storage. When
+            False, a power loss may lose the most recent events, although the
+            file itself is always left intact.
+        logger : logging.Logger, optional
+            Logger used to report background write failures.
         """
         self._active: bool = False
         self._file_path: typing.Optional[Path] = None
         self._recording_json: typing.Dict[str, typing.Any] = {}
+
+        # Direct reference to the recording's events list, so appending does
+        # not walk the JSON document on every event.
+        self._events: typing.List[typing.Dict[str, typing.Any]] = []
         self._next_index: int = 0
-        self._start_time: typing.Optional[float] = None
+        # Session start on the time.monotonic_ns() clock.
+        self._start_time_ns: typing.Optional[int] = None
         self._solution = solution
         self._last_error: typing.Optional[str] = None
 
+        # JSON text of each event, kept in step with the events list so a
+        # flush only encodes events that have changed since the last one.
+        self._encoded_events: typing.List[str] = []
+
+        # Set when events have changed since the recording was last written.
+        self._dirty: bool = False
+
+        # Writes the recording file, in the background for flush().
+        self._writer = _SnapshotWriter(
+            durable_writes, logger or logging.getLogger("webweaver_studio"))
+
     @property
     def last_error(self) -> typing.Optional[str]:
         """ Get the last error message, or None if no message """
         return self._last_error
 
+    @property
+    def write_error(self) -> typing.Optional[str]:
+        """
+        Get the error from a failed background write of the active recording.
+
+        Once set, events are no longer reaching the disk, so the caller
+        should stop the recording and inform the user.
+
+        Returns
+        -------
+        Optional[str]
+            The error message, or None if every write has succeeded.
+        """
+        return self._writer.error
+
     def is_recording(self) -> bool:
         """
         Check whether a recording session is currently active.
@@ -119,7 +299,10 @@ class RecordingSession:
         recordings_dir = self._solution.get_recordings_directory()
         recordings_dir.mkdir(parents=True, exist_ok=True)
 
-        filename: str = f"{name}_{now_utc_iso()}.wwrec"
+        # Taken once so the file name and createdAt always agree.
+        created_at: str = now_utc_iso()
+
+        filename: str = f"{name}_{created_at}.wwrec"
         self._file_path = recordings_dir / filename
 
         recording_id = str(uuid.uuid4())
@@ -129,12 +312,14 @@ class RecordingSession:
             "recording": {
                 "id": recording_id,
                 "name": name,
-                "createdAt": now_utc_iso(),
+                "createdAt": created_at,
                 "browser": self._solution.selected_browser,
                 "baseUrl": self._solution.base_url,
                 "events": []
             }
         }
+        self._events = self._recording_json["recording"]["events"]
+        self._encoded_events = []
 
         try:
             self._flush_to_disk()
@@ -144,8 +329,10 @@ class RecordingSession:
             return False
 
         self._active = True
+        self._dirty = False
         self._next_index = 0
-        self._start_time = time.monotonic()
+        self._start_time_ns = time.monotonic_ns()
+        self._writer.start()
 
         return True
 
@@ -162,9 +349,17 @@ class RecordingSession:
 
         self._recording_json["recording"]["endedAt"] = now_utc_iso()
 
-        # Persist final state
-        self._flush_to_disk()
-        self._active = False
+        # Let any background write finish so it cannot land after, and
+        # overwrite, the final state.
+        self._writer.stop()
+
+        # Persist final state. The session ends even if this write fails.
+        try:
+            self._flush_to_disk()
+
+        finally:
+            self._dirty = False
+            self._active = False
 
         return True
 
@@ -176,7 +371,8 @@ class RecordingSession:
 
         - The event index and timestamp are assigned automatically.
         - Events are always appended in chronological order.
-        - Each call immediately persists the updated recording to disk.
+        - The updated recording is persisted by the next :meth:`flush` (or
+          :meth:`stop`), so a burst of events costs a single write.
 
         This method also:
         - Coalesces consecutive DOM_TYPE / DOM_SELECT / DOM_CHECK on same element
@@ -185,51 +381,51 @@ class RecordingSession:
 
         If no recording session is currently active, this method does nothing.
         """
-        if not self._active or self._start_time is None:
+        if not self._active or self._start_time_ns is None:
             return
 
-        elapsed_ms: int = int((time.monotonic() - self._start_time) * 1000)
+        elapsed_ms: int = (time.monotonic_ns() - self._start_time_ns) // 1_000_000
+        event_type_value: str = event_type.value
 
-        events = self._recording_json["recording"]["events"]
+        events = self._events
 
         xpath = payload.get("xpath")
         if not xpath:
             return  # malformed event, ignore
 
+        # The tail event is looked up once and only refreshed if it is removed.
+        last = events[-1] if events else None
+
         # ------------------------------------------------------------
         # If this is SELECT or CHECK, and last event was CLICK
         #    on same element -> remove the click
         # ------------------------------------------------------------
-        if event_type in (RecordingEventType.DOM_SELECT, RecordingEventType.DOM_CHECK):
-            if events:
-                last = events[-1]
+        if event_type_value in _CLICK_SUPERSEDING_EVENT_TYPES:
+            if last is not None:
                 if (
-                        last["type"] == RecordingEventType.DOM_CLICK.value and
-                        last["payload"].get("xpath") == payload.get("xpath")
+                        last["type"] == _DOM_CLICK_EVENT_TYPE and
+                        last["payload"].get("xpath") == xpath
                 ):
                     events.pop()
+                    self._encoded_events.pop()
                     self._next_index -= 1
+                    last = events[-1] if events else None
 
         # ------------------------------------------------------------
         # 3) Coalesce logic (your existing logic, unchanged)
         # ------------------------------------------------------------
-        if events:
-            last = events[-1]
-
-            if event_type in (
-                    RecordingEventType.DOM_TYPE,
-                    RecordingEventType.DOM_SELECT,
-                    RecordingEventType.DOM_CHECK,
-            ):
+        if last is not None:
+            if event_type_value in _COALESCED_EVENT_TYPES:
                 if (
-                        last["type"] == event_type.value and
-                        last["payload"].get("xpath") == payload.get("xpath")
+                        last["type"] == event_type_value and
+                        last["payload"].get("xpath") == xpath
                 ):
                     # Replace last event instead of appending
                     last["timestamp"] = elapsed_ms
                     last["payload"] = payload
+                    self._encoded_events[-1] = self._encode_event(last)
 
-                    self._flush_to_disk()
+                    self._dirty = True
                     return
 
         # ------------------------------------------------------------
@@ -238,27 +434,93 @@ class RecordingSession:
         event = {
             "index": self._next_index,
             "timestamp": elapsed_ms,
-            "type": event_type.value,
+            "type": event_type_value,
             "payload": payload
         }
 
         self._next_index += 1
         events.append(event)
+        self._encoded_events.append(self._encode_event(event))
 
-        self._flush_to_disk()
+        self._dirty = True
+
+    def flush(self) -> None:
+        """
+        Write any events appended since the last write to disk.
+
+        Intended to be called periodically while recording (e.g. once per
+        recording poll) so that disk writes are decoupled from the event rate.
+        The recording is snapshotted here but written on a background thread;
+        a failed write is logged and reported through :attr:`write_error`.
+        Does nothing if no recording is active or nothing has changed.
+        """
+        if not self._active or not self._dirty:
+            return
+
+        data = encode_recording_text(self._file_path, self._recording_text())
+        self._dirty = False
+        self._writer.submit(self._file_path, data)
 
     def _flush_to_disk(self) -> None:
         """
         Write the current recording state to disk.
 
-        This overwrites the recording file with the current JSON state.
-        If no file path is set, this method does nothing.
+        This atomically replaces the recording file with the current JSON
+        state, so an interrupted write never corrupts the recording. If no
+        file path is set, this method does nothing.
         """
         if self._file_path is None:
             return
 
-        with self._file_path.open("w", encoding="utf-8") as f:
-            json.dump(self._recording_json, f, indent=4)
+        self._writer.write(self._file_path,
+                           encode_recording_text(self._file_path,
+                                                 self._recording_text()))
+
+    def _recording_text(self) -> str:
+        """
+        Build the JSON text of the recording from the cached event encodings.
+
+        Produces the same output as ``json.dumps(..., indent=4)`` on the whole
+        recording, but only the small envelope is encoded here; each event
+        was encoded once, when it was added or last changed.
+
+        Returns
+        -------
+        str
+            The recording as indented JSON text.
+        """
+        recording = dict(self._recording_json["recording"])
+        recording["events"] = _EVENTS_PLACEHOLDER
+        envelope = json.dumps({**self._recording_json, "recording": recording},
+                              indent=4)
+
+        if self._encoded_events:
+            events_text = "[\n" + ",\n".join(
+                _EVENT_INDENT + event for event in self._encoded_events) + \
+                "\n" + _EVENT_INDENT[:-4] + "]"
+        else:
+            events_text = "[]"
+
+        return envelope.replace(f'"{_EVENTS_PLACEHOLDER}"', events_text, 1)
+
+    @staticmethod
+    def _encode_event(event: typing.Dict[str, typing.Any]) -> str:
+        """
+        Encode a single event as it appears inside the recording file.
+
+        Parameters
+        ----------
+        event : dict
+            The event to encode.
+
+        Returns
+        -------
+        str
+            Indented JSON text of the event, without its leading indentation.
+        """
+        # Encoded JSON never contains a raw newline inside a string value, so
+        # every newline is a line break that needs the event's indentation.
+        return json.dumps(event, indent=4).replace("\n", "\n" + _EVENT_INDENT)
 
     def start_existing(self, doc) -> bool:
         """
@@ -279,15 +541,19 @@ class RecordingSession:
             # ------------------------------------------------------------
             self._file_path = doc.path
 
-            # If your document already exposes JSON, use that.
-            # Otherwise load from disk.
+            # If your document already exposes JSON, use that (sharing the
+            # same dict, so it is never parsed twice). Otherwise load from
+            # disk.
             if hasattr(doc, "data"):
                 self._recording_json = doc.data
             else:
-                with self._file_path.open("r", encoding="utf-8") as f:
-                    self._recording_json = json.load(f)
+                self._recording_json = json.loads(
+                    read_recording_text(self._file_path))
 
             events = self._recording_json["recording"]["events"]
+            self._events = events
+            self._encoded_events = [self._encode_event(event)
+                                    for event in events]
 
             # ------------------------------------------------------------
             # 2) Continue indexes
@@ -305,17 +571,21 @@ class RecordingSession:
             # ------------------------------------------------------------
             last_timestamp = events[-1]["timestamp"] if events else 0
 
-            self._start_time = time.monotonic() - (last_timestamp / 1000.0)
+            self._start_time_ns = time.monotonic_ns() - \
+                int(last_timestamp * 1_000_000)
 
             # Remove old endedAt — recording is live again
             self._recording_json["recording"].pop("endedAt", None)
 
+            self._dirty = False
             self._active = True
+            self._writer.start()
 
             return True
 
         except (OSError,
                 json.JSONDecodeError,
+                RecordingLoadError,
                 KeyError,
                 TypeError) as ex:
             self._last_error = f"Failed to resume recording:\n{ex}"
@@ -24,6 +24,9 @@ from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Optional
+from webweaver.studio.persistence.recording_persistence import (
+    encode_recording_text,
+    read_recording_text)
 
 
 class RecordingLoadError(Enum):
@@ -124,9 +127,8 @@ class RecordingMetadata:
             )
 
         try:
-            with wwrec_file.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (OSError, json.JSONDecodeError):
+            data = json.loads(read_recording_text(wwrec_file))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
             return RecordingLoadResult(
                 error=RecordingLoadError.FILE_MALFORMED
             )
@@ -172,8 +174,7 @@ class RecordingMetadata:
         self.file_path = Path(self.file_path)
 
         try:
-            with self.file_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json.loads(read_recording_text(self.file_path))
         except (OSError, json.JSONDecodeError):
             return False
 
@@ -183,8 +184,8 @@ class RecordingMetadata:
         data["recording"]["name"] = self.name
 
         try:
-            with self.file_path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
+            self.file_path.write_bytes(encode_recording_text(
+                self.file_path, json.dumps(data, indent=4)))
         except (OSError, TypeError, ValueError):
             return False
 
@@ -17,8 +17,8 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from io import BytesIO
 import wx
+from webweaver.studio.image_helpers import load_png_bitmap
 from .resources.explorer_tree_icons.pages_icon import PAGES_ICON
 from .resources.explorer_tree_icons.recordings_icon import RECORDINGS_ICON
 from .resources.explorer_tree_icons.root_icon import ROOT_ICON
@@ -29,10 +29,8 @@ from .resources.explorer_tree_icons.test_suites_icon import TEST_SUITES_ICON
 
 def _load_icon(png_bytes: bytes) -> wx.Bitmap:
     """
-    Create a wx.Bitmap suitable for use as an icon from in-memory PNG data.
-
-    The PNG data is loaded into a wx.Image, scaled to 16×16 pixels using
-    high-quality interpolation, and then converted to a wx.Bitmap.
+    Create a wx.Bitmap suitable for use as a solution explorer tree icon
+    from in-memory PNG data.
 
     Parameters
     ----------
@@ -42,15 +40,9 @@ def _load_icon(png_bytes: bytes) -> wx.Bitmap:
     Returns
     -------
     wx.Bitmap
-        A bitmap scaled to 16×16 pixels, suitable for use in toolbars.
+        A bitmap scaled to 16×16 pixels, suitable for use in the tree.
     """
-    stream = BytesIO(png_bytes)
-    image = wx.Image(stream)
-
-    # Force 32x32, high quality (matches C++)
-    image = image.Scale(16, 16, wx.IMAGE_QUALITY_HIGH)
-
-    return wx.Bitmap(image)
+    return load_png_bitmap(png_bytes, 16)
 
 
 def load_root_icon() -> wx.Bitmap:
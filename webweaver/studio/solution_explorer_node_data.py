@@ -50,6 +50,7 @@ class SolutionExplorerNodeData:
     This allows the tree UI to remain lightweight while still supporting
     context-sensitive actions like opening, renaming, or deleting items.
     """
+    __slots__ = ['_node_type', '_metadata']
 
     def __init__(self,
                  node_type: ExplorerNodeType,
@@ -65,7 +66,6 @@ class SolutionExplorerNodeData:
             Metadata associated with the node, typically representing a
             recording item. May be ``None`` for non-recording nodes.
         """
-        super().__init__()
         self._node_type = node_type
         self._metadata = metadata
 
@@ -26,6 +26,8 @@ from webweaver.studio.browser_launch_options import BrowserLaunchOptions
 from webweaver.studio.recording_metadata import (RecordingMetadata,
                                                  recording_load_error_to_str)
 from webweaver.studio.recording_view_context import RecordingViewContext
+from webweaver.studio.persistence.recording_persistence import \
+    is_recording_file
 from webweaver.studio.persistence.solution_persistence import \
     SolutionDirectoryCreateStatus
 
@@ -330,7 +332,7 @@ class StudioSolution:
         for entry in rec_dir.iterdir():
             if not entry.is_file():
                 continue
-            if entry.suffix != ".wwrec":
+            if not is_recording_file(entry):
                 continue
 
             result = RecordingMetadata.from_file(entry)
@@ -17,8 +17,8 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-import io
 import wx
+from webweaver.studio.image_helpers import load_png_bitmap
 from webweaver.studio.resources.webweaver_main_logo import WEBWEAVER_MAIN_LOGO
 from webweaver.studio.version import __version__
 
@@ -72,10 +72,8 @@ class AboutDialog(wx.Dialog):
         vbox = wx.BoxSizer(wx.VERTICAL)
 
         # --- Logo from embedded bytes ---
-        stream = io.BytesIO(WEBWEAVER_MAIN_LOGO)
-        image = wx.Image(stream, wx.BITMAP_TYPE_PNG)
-        image = image.Scale(256, 256, wx.IMAGE_QUALITY_HIGH)
-        bitmap = wx.StaticBitmap(panel, bitmap=wx.Bitmap(image))
+        bitmap = wx.StaticBitmap(
+            panel, bitmap=load_png_bitmap(WEBWEAVER_MAIN_LOGO, 256))
 
         # --- Text ---
         title = wx.StaticText(panel, label="WebWeaver Studio")
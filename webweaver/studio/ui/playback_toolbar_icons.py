@@ -17,8 +17,8 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from io import BytesIO
 import wx
+from webweaver.studio.image_helpers import load_png_bitmap
 # Import generated icon byte data
 from webweaver.studio.resources.playback_toolbar.toolbar_pause import PAUSE_ICON
 from webweaver.studio.resources.playback_toolbar.toolbar_play import PLAY_ICON
@@ -28,10 +28,8 @@ from webweaver.studio.resources.playback_toolbar.toolbar_stop import STOP_ICON
 
 def _load_toolbar_icon(png_bytes: bytes) -> wx.Bitmap:
     """
-    Create a wx.Bitmap suitable for use in a toolbar from in-memory PNG data.
-
-    The PNG data is loaded into a wx.Image, scaled to 32×32 pixels using
-    high-quality interpolation, and then converted to a wx.Bitmap.
+    Create a wx.Bitmap suitable for use in the playback toolbar from
+    in-memory PNG data.
 
     Parameters
     ----------
@@ -43,13 +41,7 @@ def _load_toolbar_icon(png_bytes: bytes) -> wx.Bitmap:
     wx.Bitmap
         A bitmap scaled to 32×32 pixels, suitable for use in toolbars.
     """
-    stream = BytesIO(png_bytes)
-    image = wx.Image(stream)
-
-    # Force 32x32, high quality (matches C++)
-    image = image.Scale(32, 32, wx.IMAGE_QUALITY_HIGH)
-
-    return wx.Bitmap(image)
+    return load_png_bitmap(png_bytes, 32)
 
 
 def load_playback_toolbar_pause_icon() -> wx.Bitmap:
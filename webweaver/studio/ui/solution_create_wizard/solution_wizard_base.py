@@ -17,6 +17,7 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import contextlib
 import enum
 import wx
 from webweaver.studio.wizard_step_indicator import WizardStepIndicator
@@ -52,7 +53,9 @@ class SolutionWizardBase(wx.Dialog):
 
     Each concrete wizard page should inherit from this class, call the base
     constructor, and then populate `self._main_sizer` with its page-specific
-    controls before calling `SetSizerAndFit`.
+    controls before calling `SetSizerAndFit`. Pages with many controls can
+    instead build them inside a `with self._building_page():` block, which
+    suspends repainting and sizes the dialog once they are all in place.
 
     The wizard is modal: pages should call `EndModal(wx.ID_OK)` to advance or
     `EndModal(wx.ID_CANCEL)` to cancel.
@@ -97,6 +100,27 @@ class SolutionWizardBase(wx.Dialog):
             self, self.STEPS, step_index)
         self._main_sizer.Add(step_indicator, 0, wx.EXPAND | wx.ALL, 10)
 
+    @contextlib.contextmanager
+    def _building_page(self):
+        """
+        Context manager wrapping the construction of a page's controls.
+
+        Repainting is suspended while the page creates its controls and adds
+        them to `self._main_sizer`, so wx performs a single layout and paint
+        rather than one per control. On leaving the block the dialog is
+        thawed, sized to fit `self._main_sizer` and centred on its parent.
+        """
+        self.Freeze()
+
+        try:
+            yield
+
+        finally:
+            self.Thaw()
+
+        self.SetSizerAndFit(self._main_sizer)
+        self.CentreOnParent()
+
     def _create_header(self, title_str: str, subtitle_str: str):
         """
         Create and add a standard wizard page header.
@@ -92,22 +92,24 @@ class WizardBehaviourPage(SolutionWizardBase):
         super().__init__("Finalisation your solution",
                          parent, data, 2)
 
-        # Recording behaviour controls
-        self._behaviour_controls = BehaviourPageControls()
+        # Custom size state last applied to the width/height fields, so
+        # redundant Enable() calls can be skipped.
+        self._last_custom_state: bool | None = None
 
-        # Header
-        self._create_header(self.TITLE_STR, self.SUBTITLE_STR)
+        with self._building_page():
+            # Recording behaviour controls
+            self._behaviour_controls = BehaviourPageControls()
 
-        # Wizard contents
-        content_sizer = wx.BoxSizer(wx.VERTICAL)
-        self._create_behaviour_panel(content_sizer)
-        self._main_sizer.Add(content_sizer, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 20)
+            # Header
+            self._create_header(self.TITLE_STR, self.SUBTITLE_STR)
 
-        # Button bar
-        self._create_buttons_bar(self._on_next_click_event)
+            # Wizard contents
+            content_sizer = wx.BoxSizer(wx.VERTICAL)
+            self._create_behaviour_panel(content_sizer)
+            self._main_sizer.Add(content_sizer, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 20)
 
-        self.SetSizerAndFit(self._main_sizer)
-        self.CentreOnParent()
+            # Button bar
+            self._create_buttons_bar(self._on_next_click_event)
 
     def _create_behaviour_panel(self, parent: wx.BoxSizer) -> None:
         behaviour_box = wx.StaticBoxSizer(wx.VERTICAL,
@@ -132,16 +134,13 @@ class WizardBehaviourPage(SolutionWizardBase):
         self._behaviour_controls.private.SetValue(True)
         self._behaviour_controls.disable_extensions.SetValue(True)
         self._behaviour_controls.disable_notifications.SetValue(True)
-        behaviour_box.Add(self._behaviour_controls.private, 0, wx.ALL, 5)
-        behaviour_box.Add(self._behaviour_controls.disable_extensions,
-                          0, wx.ALL, 5)
-        behaviour_box.Add(self._behaviour_controls.disable_notifications,
-                          0, wx.ALL, 5)
-        behaviour_box.Add(self._behaviour_controls.ignore_cert_errors,
-                          0, wx.ALL, 5)
-        behaviour_box.Add(
-            self._behaviour_controls.disable_automation_controlled_feature,
-            0, wx.ALL, 5)
+        behaviour_box.AddMany([
+            (self._behaviour_controls.private, 0, wx.ALL, 5),
+            (self._behaviour_controls.disable_extensions, 0, wx.ALL, 5),
+            (self._behaviour_controls.disable_notifications, 0, wx.ALL, 5),
+            (self._behaviour_controls.ignore_cert_errors, 0, wx.ALL, 5),
+            (self._behaviour_controls.disable_automation_controlled_feature,
+             0, wx.ALL, 5)])
 
         behaviour_box.AddSpacer(10)
 
@@ -150,7 +149,6 @@ class WizardBehaviourPage(SolutionWizardBase):
         # =====================
         window_label = wx.StaticText(self,  wx.ID_ANY, "Browser window")
         window_label.SetFont(window_label.GetFont().Bold())
-        behaviour_box.Add(window_label, 0, wx.ALL, 5)
         self._behaviour_controls.window_size_default = wx.RadioButton(
             self, wx.ID_ANY, "Default size", style=wx.RB_GROUP)
         self._behaviour_controls.window_size_maximised = wx.RadioButton(
@@ -163,68 +161,69 @@ class WizardBehaviourPage(SolutionWizardBase):
             self, wx.ID_ANY, "800", size=(60, -1))
 
         size_sizer: wx.BoxSizer = wx.BoxSizer(wx.HORIZONTAL)
-        size_sizer.Add(self._behaviour_controls.window_size_width,
-                       0, wx.RIGHT, 5)
-        size_sizer.Add(wx.StaticText(self,  wx.ID_ANY, "×"),
-                       0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
-        size_sizer.Add(self._behaviour_controls.window_size_height, 0)
-        behaviour_box.Add(self._behaviour_controls.window_size_default,
-                          0, wx.ALL, 5)
-        behaviour_box.Add(self._behaviour_controls.window_size_maximised,
-                          0, wx.ALL, 5)
-        behaviour_box.Add(self._behaviour_controls.window_size_custom,
-                          0, wx.LEFT | wx.TOP, 5)
-        behaviour_box.Add(size_sizer, 0, wx.LEFT | wx.BOTTOM, 10)
+        size_sizer.AddMany([
+            (self._behaviour_controls.window_size_width, 0, wx.RIGHT, 5),
+            (wx.StaticText(self,  wx.ID_ANY, "×"),
+             0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5),
+            (self._behaviour_controls.window_size_height, 0)])
+        behaviour_box.AddMany([
+            (window_label, 0, wx.ALL, 5),
+            (self._behaviour_controls.window_size_default, 0, wx.ALL, 5),
+            (self._behaviour_controls.window_size_maximised, 0, wx.ALL, 5),
+            (self._behaviour_controls.window_size_custom,
+             0, wx.LEFT | wx.TOP, 5),
+            (size_sizer, 0, wx.LEFT | wx.BOTTOM, 10)])
 
         self._behaviour_controls.window_size_maximised.SetValue(True)
         self._sync_window_size_state()
 
         self._behaviour_controls.window_size_maximised.Bind(
-            wx.EVT_RADIOBUTTON, lambda evt: self._sync_window_size_state()
-        )
+            wx.EVT_RADIOBUTTON, self._sync_window_size_state)
         self._behaviour_controls.window_size_custom.Bind(
-            wx.EVT_RADIOBUTTON, lambda evt: self._sync_window_size_state()
-        )
+            wx.EVT_RADIOBUTTON, self._sync_window_size_state)
 
         # Advanced section
         advanced_pane = wx.CollapsiblePane(self,  wx.ID_ANY, "Advanced")
         pane: wx.Window = advanced_pane.GetPane()
 
-        adv_sizer: wx.BoxSizer = wx.BoxSizer(wx.VERTICAL)
-        adv_sizer.Add(wx.StaticText(pane,
-                                    wx.ID_ANY,
-                                    "User agent override"),
-                      0, wx.BOTTOM, 5)
         self._behaviour_controls.user_agent = wx.TextCtrl(pane,  wx.ID_ANY)
-        adv_sizer.Add(self._behaviour_controls.user_agent, 0, wx.EXPAND)
+
+        adv_sizer: wx.BoxSizer = wx.BoxSizer(wx.VERTICAL)
+        adv_sizer.AddMany([
+            (wx.StaticText(pane, wx.ID_ANY, "User agent override"),
+             0, wx.BOTTOM, 5),
+            (self._behaviour_controls.user_agent, 0, wx.EXPAND)])
 
         pane.SetSizer(adv_sizer)
         behaviour_box.Add(advanced_pane, 0, wx.EXPAND | wx.ALL, 5)
 
         parent.Add(behaviour_box, 1, wx.EXPAND)
 
-    def _sync_window_size_state(self) -> None:
-        custom: bool = self._behaviour_controls.window_size_custom.GetValue()
-        self._behaviour_controls.window_size_width.Enable(custom)
-        self._behaviour_controls.window_size_height.Enable(custom)
+    def _sync_window_size_state(self,
+                                _event: wx.CommandEvent | None = None) -> None:
+        controls: BehaviourPageControls = self._behaviour_controls
+        custom: bool = controls.window_size_custom.GetValue()
+
+        if custom == self._last_custom_state:
+            return
+
+        self._last_custom_state = custom
+        controls.window_size_width.Enable(custom)
+        controls.window_size_height.Enable(custom)
 
     def _on_next_click_event(self, _event: wx.CommandEvent) -> None:
         opts: BrowserLaunchOptions = self._data.browser_launch_options
+        controls: BehaviourPageControls = self._behaviour_controls
 
-        opts.private_mode = self._behaviour_controls.private.GetValue()
-        opts.disable_extensions = \
-            self._behaviour_controls.disable_extensions.GetValue()
-        opts.disable_notifications = \
-            self._behaviour_controls.disable_notifications.GetValue()
-        opts.ignore_certificate_errors = \
-            self._behaviour_controls.ignore_cert_errors.GetValue()
+        opts.private_mode = controls.private.GetValue()
+        opts.disable_extensions = controls.disable_extensions.GetValue()
+        opts.disable_notifications = controls.disable_notifications.GetValue()
+        opts.ignore_certificate_errors = controls.ignore_cert_errors.GetValue()
         opts.disable_automation_controlled_feature = \
-            self._behaviour_controls.disable_automation_controlled_feature.GetValue()
+            controls.disable_automation_controlled_feature.GetValue()
 
-        opts.maximised = \
-            self._behaviour_controls.window_size_maximised.GetValue()
-        default_window_size: bool = \
-            self._behaviour_controls.window_size_default.GetValue()
+        opts.maximised = controls.window_size_maximised.GetValue()
+        default_window_size: bool = controls.window_size_default.GetValue()
 
         if opts.maximised:
             opts.window_size = None
@@ -235,20 +234,20 @@ class WizardBehaviourPage(SolutionWizardBase):
 
         else:
             # Custom window size
-            try:
-                width = \
-                    int(self._behaviour_controls.window_size_width.GetValue())
-                height = \
-                    int(self._behaviour_controls.window_size_height.GetValue())
-            except ValueError:
+            width: str = controls.window_size_width.GetValue().strip()
+            height: str = controls.window_size_height.GetValue().strip()
+
+            # isdecimal() accepts exactly the digits int() does, so invalid
+            # input is rejected without raising and catching ValueError.
+            if not (width.isdecimal() and height.isdecimal()):
                 wx.MessageBox("Please enter valid numeric window dimensions.",
                               "Invalid input", wx.ICON_WARNING)
                 return
 
-            opts.window_size = WindowSize(width=width, height=height)
+            opts.window_size = WindowSize(width=int(width), height=int(height))
             opts.maximised = False
 
-        user_agent: str = self._behaviour_controls.user_agent.GetValue().strip()
+        user_agent: str = controls.user_agent.GetValue().strip()
         if user_agent:
             opts.user_agent = user_agent
 
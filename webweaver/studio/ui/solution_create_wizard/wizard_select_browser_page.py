@@ -17,6 +17,7 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import functools
 import wx
 from .solution_create_wizard_data import SolutionCreateWizardData
 from .solution_creation_page import SolutionCreationPage
@@ -27,6 +28,29 @@ from .browser_logos import (
     load_browser_logo_microsoft_edge)
 from .solution_wizard_base import SolutionWizardBase
 
+# Text colours shared by every instance of the page
+_HINT_COLOUR = wx.Colour(120, 120, 120)
+_LABEL_COLOUR = wx.Colour(80, 80, 80)
+
+
+@functools.lru_cache(maxsize=None)
+def _bold_label_font() -> wx.Font:
+    """
+    Return the bold font used for section labels on this page.
+
+    The font is created on first use, once the wx.App exists, and is then
+    shared by every instance of the page.
+
+    Returns
+    -------
+    wx.Font
+        A 10 point bold font in the default family.
+    """
+    return wx.Font(10,
+                   wx.FONTFAMILY_DEFAULT,
+                   wx.FONTSTYLE_NORMAL,
+                   wx.FONTWEIGHT_BOLD)
+
 
 class WizardSelectBrowserPage(SolutionWizardBase):
     """
@@ -67,104 +91,100 @@ class WizardSelectBrowserPage(SolutionWizardBase):
         """
         super().__init__("Solution Wizard",
                          parent, data, 1)
-        self._browser_buttons = []
-
-        # --- Header ---
-        self._create_header(self.TITLE_STR, self.SUBTITLE_STR)
-
-        # URL
-        url_sizer: wx.BoxSizer = wx.BoxSizer(wx.VERTICAL)
-        url_sizer.Add(wx.StaticText(self, wx.ID_ANY, "URL"), 0, wx.BOTTOM, 4)
-        self._txt_base_url = wx.TextCtrl(self, wx.ID_ANY, self.DEFAULT_URL)
-        url_sizer.Add(self._txt_base_url, 0, wx.EXPAND)
-        self._main_sizer.Add(url_sizer, 0, wx.EXPAND | wx.ALL, 10)
-
-        # Browser label + hint
-        lbl_browser: wx.StaticText = wx.StaticText(
-            self, wx.ID_ANY, "Select browser")
-        lbl_browser.SetFont(wx.Font(10,
-                                    wx.FONTFAMILY_DEFAULT,
-                                    wx.FONTSTYLE_NORMAL,
-                                    wx.FONTWEIGHT_BOLD))
-        self._main_sizer.Add(lbl_browser, 0, wx.LEFT | wx.RIGHT, 10)
-
-        hint: wx.StaticText = wx.StaticText(
-            self, wx.ID_ANY,
-            "The selected browser must be installed on this system.")
-        hint.SetForegroundColour(wx.Colour(120, 120, 120))
-        self._main_sizer.Add(hint, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
-
-        # Scrollable browser icons(simplified)
-        scroll: wx.ScrolledWindow = wx.ScrolledWindow(
-            self,
-            wx.ID_ANY,
-            wx.DefaultPosition,
-            wx.DefaultSize,
-            wx.HSCROLL | wx.BORDER_NONE)
-        scroll.SetScrollRate(10, 0)
-        scroll.SetMinSize(wx.Size(-1, 110))
-
-        hsizer: wx.BoxSizer = wx.BoxSizer(wx.HORIZONTAL)
-
-        # List of browsers
-        browsers = [
-            ("Chrome", load_browser_logo_google_chrome()),
-            ("Chromium", load_browser_logo_chromium()),
-            ("Edge (Chromium)", load_browser_logo_microsoft_edge()),
-            ("Firefox", load_browser_logo_firefox())
-        ]
-
-        self._browser_buttons.clear()
-
-        for name, bmp in browsers:
-            col = wx.BoxSizer(wx.VERTICAL)
-            btn = wx.BitmapToggleButton(scroll, wx.ID_ANY, bmp)
-
-            label = wx.StaticText(scroll, wx.ID_ANY, name)
-            label.SetForegroundColour(wx.Colour(80, 80, 80))
-
-            col.Add(btn, 0, wx.ALIGN_CENTER | wx.BOTTOM, 4)
-            col.Add(label, 0, wx.ALIGN_CENTER)
-            hsizer.Add(col, 0, wx.RIGHT, 20)
-
-            btn.Bind(wx.EVT_TOGGLEBUTTON, self._on_browser_toggle_event)
-            self._browser_buttons.append((name, btn))
-
-        scroll.SetSizer(hsizer)
-        self._main_sizer.Add(
-            scroll,
-            0,
-            wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM,
-            10)
-
-        # Launch browser checkbox
-        self._chk_launch_browser: wx.CheckBox = wx.CheckBox(
-            self,
-            wx.ID_ANY,
-            "Launch browser automatically. Uncheck if browser is already running.")
-        self._main_sizer.Add(self._chk_launch_browser,
-                             0,
-                             wx.LEFT | wx.RIGHT | wx.BOTTOM,
-                             10)
-
-        # Button bar
-        self._create_buttons_bar(self._on_next_click_event)
-
-        self.SetSizerAndFit(self._main_sizer)
-        self.CentreOnParent()
+        self._browser_buttons: dict[int, tuple[str, wx.BitmapToggleButton]] = {}
+        self._selected_browser_id: int | None = None
+
+        with self._building_page():
+            # --- Header ---
+            self._create_header(self.TITLE_STR, self.SUBTITLE_STR)
+
+            # URL
+            url_sizer: wx.BoxSizer = wx.BoxSizer(wx.VERTICAL)
+            url_sizer.Add(wx.StaticText(self, wx.ID_ANY, "URL"), 0, wx.BOTTOM, 4)
+            self._txt_base_url = wx.TextCtrl(self, wx.ID_ANY, self.DEFAULT_URL)
+            url_sizer.Add(self._txt_base_url, 0, wx.EXPAND)
+            self._main_sizer.Add(url_sizer, 0, wx.EXPAND | wx.ALL, 10)
+
+            # Browser label + hint
+            lbl_browser: wx.StaticText = wx.StaticText(
+                self, wx.ID_ANY, "Select browser")
+            lbl_browser.SetFont(_bold_label_font())
+            self._main_sizer.Add(lbl_browser, 0, wx.LEFT | wx.RIGHT, 10)
+
+            hint: wx.StaticText = wx.StaticText(
+                self, wx.ID_ANY,
+                "The selected browser must be installed on this system.")
+            hint.SetForegroundColour(_HINT_COLOUR)
+            self._main_sizer.Add(hint, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
+
+            # Scrollable browser icons(simplified)
+            scroll: wx.ScrolledWindow = wx.ScrolledWindow(
+                self,
+                wx.ID_ANY,
+                wx.DefaultPosition,
+                wx.DefaultSize,
+                wx.HSCROLL | wx.BORDER_NONE)
+            scroll.SetScrollRate(10, 0)
+            scroll.SetMinSize(wx.Size(-1, 110))
+
+            hsizer: wx.BoxSizer = wx.BoxSizer(wx.HORIZONTAL)
+
+            # List of browsers
+            browsers = [
+                ("Chrome", load_browser_logo_google_chrome()),
+                ("Chromium", load_browser_logo_chromium()),
+                ("Edge (Chromium)", load_browser_logo_microsoft_edge()),
+                ("Firefox", load_browser_logo_firefox())
+            ]
+
+            for name, bmp in browsers:
+                col = wx.BoxSizer(wx.VERTICAL)
+                btn = wx.BitmapToggleButton(scroll, wx.ID_ANY, bmp)
+
+                label = wx.StaticText(scroll, wx.ID_ANY, name)
+                label.SetForegroundColour(_LABEL_COLOUR)
+
+                col.Add(btn, 0, wx.ALIGN_CENTER | wx.BOTTOM, 4)
+                col.Add(label, 0, wx.ALIGN_CENTER)
+                hsizer.Add(col, 0, wx.RIGHT, 20)
+
+                btn.Bind(wx.EVT_TOGGLEBUTTON, self._on_browser_toggle_event)
+                self._browser_buttons[btn.GetId()] = (name, btn)
+
+            scroll.SetSizer(hsizer)
+            self._main_sizer.Add(
+                scroll,
+                0,
+                wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM,
+                10)
+
+            # Launch browser checkbox
+            self._chk_launch_browser: wx.CheckBox = wx.CheckBox(
+                self,
+                wx.ID_ANY,
+                "Launch browser automatically. Uncheck if browser is already running.")
+            self._main_sizer.Add(self._chk_launch_browser,
+                                 0,
+                                 wx.LEFT | wx.RIGHT | wx.BOTTOM,
+                                 10)
+
+            # Button bar
+            self._create_buttons_bar(self._on_next_click_event)
 
     def _on_browser_toggle_event(self, event: wx.CommandEvent) -> None:
         """
             Ensure that only one browser toggle button can be active at a time.
 
-            When a browser button is clicked, this handler deactivates all other
-            buttons in ``browser_buttons`` to enforce exclusive selection.
+            When a browser button is clicked, this handler deactivates the
+            previously selected button, if any, to enforce exclusive selection
+            and records which button is now pressed.
         """
-        clicked: wx.Window = event.GetEventObject()
+        clicked_id: int = event.GetId()
+
+        if self._selected_browser_id not in (None, clicked_id):
+            self._browser_buttons[self._selected_browser_id][1].SetValue(False)
 
-        for _name, btn in self._browser_buttons:
-            if btn is not clicked:
-                btn.SetValue(False)
+        self._selected_browser_id = clicked_id if event.IsChecked() else None
 
         event.Skip()
 
@@ -193,18 +213,15 @@ class WizardSelectBrowserPage(SolutionWizardBase):
                           wx.ICON_WARNING)
             return False
 
-        selected_browser: str = ""
-        for name, btn in self._browser_buttons:
-            if btn.GetValue():
-                selected_browser = name
-                break
-
-        if not selected_browser:
+        if self._selected_browser_id is None:
             wx.MessageBox("Please select a browser.",
                           "Missing information",
                           wx.ICON_WARNING)
             return False
 
+        selected_browser: str = \
+            self._browser_buttons[self._selected_browser_id][0]
+
         self._data.base_url = base_url
         self._data.browser = selected_browser
         self._data.launch_browser_automatically = \
@@ -42,8 +42,9 @@ from webweaver.studio.persistence.solution_persistence import (
                                                 SolutionPersistence,
                                                 SolutionSaveStatus)
 from webweaver.studio.persistence.recording_document import RecordingDocument
-from webweaver.studio.persistence.recording_persistence import \
-    RecordingPersistence
+from webweaver.studio.persistence.recording_persistence import (
+    RecordingPersistence,
+    recording_file_stem)
 from webweaver.studio.browsing.web_driver_factory import \
     create_driver_from_solution
 from webweaver.studio.browsing.studio_browser import StudioBrowser
@@ -439,7 +440,8 @@ class StudioMainFrame(wx.Frame):
         settings = entry.settings_cls()
 
         # 3. Attempt to load generator-specific settings if they exist
-        codegen_path = doc.path.with_suffix(".codegen")
+        codegen_path = doc.path.with_name(
+            f"{recording_file_stem(doc.path)}.codegen")
         if codegen_path.exists():
             try:
                 with open(codegen_path, "r", encoding="utf-8") as f:
@@ -489,8 +491,9 @@ class StudioMainFrame(wx.Frame):
         Return the RecordingDocument for the currently active workspace page.
 
         This method queries the workspace for the active viewer and, if it
-        represents a recording-backed view, loads and returns the corresponding
-        RecordingDocument from disk.
+        represents a recording-backed view, returns the corresponding
+        RecordingDocument. The document is loaded lazily, so the recording file
+        is only read and parsed if the caller accesses its data.
 
         This method returns None if:
             - The workspace panel does not exist
@@ -509,7 +512,8 @@ class StudioMainFrame(wx.Frame):
         if not page:
             return None
 
-        return RecordingPersistence.load_from_disk(page.get_recording_file())
+        return RecordingPersistence.load_from_disk(page.get_recording_file(),
+                                                   lazy=True)
 
     def on_refresh_codegen_generators(self, _evt):
         """
@@ -630,7 +634,8 @@ class StudioMainFrame(wx.Frame):
 
         self.rebuild_recent_solutions_menu()
 
-        self._recording_session = RecordingSession(self._current_solution)
+        self._recording_session = RecordingSession(self._current_solution,
+                                                   logger=self._logger)
 
         # Update solution name in the status bar.
         self._status_bar.set_status_bar_current_solution(
@@ -664,7 +669,7 @@ class StudioMainFrame(wx.Frame):
                     )
 
                     self._recording_session = RecordingSession(
-                        self._current_solution)
+                        self._current_solution, logger=self._logger)
 
         finally:
             dlg.Destroy()
@@ -1493,7 +1498,7 @@ class StudioMainFrame(wx.Frame):
         self._open_solution(self._recent_solutions.get_solutions()[index])
 
         self._recording_session = RecordingSession(
-            self._current_solution)
+            self._current_solution, logger=self._logger)
 
     def _update_toolbar_state(self) -> None:
         """
@@ -1724,6 +1729,43 @@ class StudioMainFrame(wx.Frame):
 
             self._logger.debug("Recorded event: %s", ev)
 
+        # Write the whole batch polled this tick to disk in one go.
+        self._recording_session.flush()
+
+        # A failed background write means events are no longer being saved.
+        write_error = self._recording_session.write_error
+        if write_error:
+            self._abort_recording_on_write_error(write_error)
+
+    def _abort_recording_on_write_error(self, write_error: str):
+        """
+        Stop a recording whose file can no longer be written and tell the user.
+
+        Args:
+            write_error: The error reported by the recording session.
+        """
+        self._logger.error("Recording stopped after a write failure: %s",
+                           write_error)
+
+        try:
+            self._recording_session.stop()
+
+        except OSError as e:
+            self._logger.error("Failed to write final recording state: %s", e)
+
+        # force state back
+        self._state_controller.on_record_start_stop()
+
+        self._web_browser.disable_record_mode()
+        self._recording_timer.Stop()
+
+        wx.MessageBox(
+            f"{write_error}\n\nRecording has been stopped. Events recorded "
+            "after the last successful save have not been saved.",
+            "Recording Error",
+            wx.ICON_ERROR,
+            self)
+
     def _on_close_app(self, event):
         result = wx.MessageBox(
             "Are you sure you want to exit?",